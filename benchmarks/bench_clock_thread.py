@@ -0,0 +1,110 @@
+"""
+Дрожание тактов часов при загруженном потоке GUI.
+
+Поток GUI занят имитацией тяжёлой перерисовки: каждые LOAD_PERIOD_MS
+он LOAD_BUSY_MS выполняет вычисления. Сравниваются:
+- часы в потоке GUI (как раньше);
+- часы в отдельном потоке (ClockThread).
+
+Для каждого варианта печатаются опоздание такта самого таймера
+(PreciseTimer.stats) и опоздание доставки draw_time в поток GUI
+относительно точного момента смены секунды.
+
+Запуск из корня проекта:
+    python benchmarks/bench_clock_thread.py
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt6.QtCore import QEventLoop, QTimer
+from PyQt6.QtWidgets import QApplication
+
+from timer_2.clock import Clock
+from timer_2.clock_thread import ClockThread
+from timer_2.tick_stats import TickStats
+from timer_2.tunes_defaults import default_model
+
+SECONDS = 600
+MEASURE_MS = 10_000
+LOAD_PERIOD_MS = 100
+LOAD_BUSY_MS = 60
+
+
+def busy() -> None:
+    until = time.perf_counter() + LOAD_BUSY_MS / 1000
+    while time.perf_counter() < until:
+        pass
+
+
+def run_for(ms: int) -> None:
+    loop = QEventLoop()
+    QTimer.singleShot(ms, loop.quit)
+    loop.exec()
+
+
+def measure(threaded: bool) -> tuple[TickStats, TickStats]:
+    model = default_model()
+    model.voice_interval = SECONDS
+    model.beep_period_in_final = 0
+    settings = SimpleNamespace(model=model)
+
+    clock = (
+        ClockThread(SECONDS, settings)  # type: ignore[arg-type]
+        if threaded
+        else Clock(SECONDS, settings)  # type: ignore[arg-type]
+    )
+    delivery = TickStats(SECONDS, 1000)
+
+    def on_draw(seconds: int) -> None:
+        source = clock.worker.clock if isinstance(clock, ClockThread) else clock
+        assert source is not None
+        due = source.deadline - seconds
+        delivery.record((time.monotonic() - due) * 1000)
+
+    clock.connect("draw_time", on_draw)
+    clock.connect("inform_voice", lambda seconds: None)
+    clock.connect("inform_done", lambda: None)
+
+    load = QTimer()
+    load.timeout.connect(busy)
+    load.start(LOAD_PERIOD_MS)
+    clock.start()
+    run_for(MEASURE_MS)
+    load.stop()
+
+    timer = clock.timer
+    assert timer is not None
+    ticks = timer.stats
+    clock.cancel()
+    return ticks, delivery
+
+
+def row(name: str, stats: TickStats) -> str:
+    return (
+        f"{name:>24} {stats.percentile(50):>8.1f} {stats.percentile(99):>8.1f} "
+        f"{stats.max():>8.1f}"
+    )
+
+
+def main() -> None:
+    app = QApplication(sys.argv)
+    print(f"{'опоздание, мс':>24} {'p50':>8} {'p99':>8} {'макс':>8}")
+    for threaded in (False, True):
+        ticks, delivery = measure(threaded)
+        variant = "поток часов" if threaded else "поток GUI"
+        print(row(f"{variant}: такт", ticks))
+        print(row(f"{variant}: draw_time", delivery))
+    app.quit()
+
+
+if __name__ == "__main__":
+    main()
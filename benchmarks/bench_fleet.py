@@ -0,0 +1,82 @@
+"""
+Время одного такта для множества таймеров.
+
+Сравниваются два варианта:
+- Clock.on_time_out для каждого таймера;
+- один ClockFleet.tick для всех таймеров.
+
+Запуск из корня проекта:
+    python benchmarks/bench_fleet.py
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from timer_2.clock import Clock
+from timer_2.clock_fleet import ClockFleet
+from timer_2.tunes_defaults import default_model
+
+COUNTS = (100, 1_000, 10_000, 100_000)
+TICKS = 20
+
+
+def make_clocks(count: int) -> list[Clock]:
+    settings = SimpleNamespace(model=default_model())
+    clocks = []
+    for _ in range(count):
+        clock = Clock(random.randrange(60, 24 * 3600), settings)  # type: ignore[arg-type]
+        clock.connect("draw_time", lambda seconds: None)
+        clock.connect("inform_voice", lambda seconds: None)
+        clock.connect("inform_done", lambda: None)
+        clocks.append(clock)
+    return clocks
+
+
+def make_fleet(count: int) -> ClockFleet:
+    model = default_model()
+    fleet = ClockFleet(capacity=count)
+    for _ in range(count):
+        fleet.add(
+            random.randrange(60, 24 * 3600),
+            model.voice_interval,
+            model.beep_interval,
+            model.beep_period_in_final,
+        )
+    fleet.connect("inform_voice", lambda index, seconds: None)
+    fleet.connect("inform_beep", lambda index, seconds: None)
+    fleet.connect("inform_done", lambda index, seconds: None)
+    return fleet
+
+
+def tick_ms(tick: Callable[[], object], ticks: int = TICKS) -> float:
+    started = time.perf_counter()
+    for _ in range(ticks):
+        tick()
+    return (time.perf_counter() - started) / ticks * 1000
+
+
+def main() -> None:
+    print(f"{'таймеров':>9} {'Clock, мс':>10} {'ClockFleet, мс':>15}")
+    for count in COUNTS:
+        clocks = make_clocks(count)
+
+        def tick_clocks() -> None:
+            for clock in clocks:
+                clock.on_time_out()
+
+        per_clock = tick_ms(tick_clocks)
+        fleet = make_fleet(count)
+        batched = tick_ms(fleet.tick)
+        print(f"{count:>9} {per_clock:>10.3f} {batched:>15.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+Время запуска и память часов без Qt и с Qt.
+
+Каждый вариант запускается в отдельном процессе, который ведёт
+короткий отсчёт (COUNTDOWN_SECONDS) и сообщает:
+- время импорта модулей часов;
+- время от старта процесса до первого draw_time;
+- пиковый размер резидентной памяти (ru_maxrss).
+
+Варианты:
+- asyncio: CountdownEngine на AsyncioTimeSource;
+- Qt: Clock на QtTimeSource в QCoreApplication.
+
+Запуск из корня проекта (только Linux/macOS, нужен модуль resource):
+    python benchmarks/bench_headless.py
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+COUNTDOWN_SECONDS = 2
+RUNS = 5
+
+ASYNCIO_CHILD = """
+import asyncio, json, resource, sys, time
+t0 = time.perf_counter()
+from timer_2.countdown import CountdownEngine
+from timer_2.tunes_defaults import default_model
+imported = time.perf_counter() - t0
+first = []
+
+def on_draw(seconds):
+    if not first:
+        first.append(time.perf_counter() - t0)
+
+async def main():
+    engine = CountdownEngine({seconds}, default_model())
+    engine.connect("draw_time", on_draw)
+    await engine.run()
+
+asyncio.run(main())
+print(json.dumps({{"import": imported, "first": first[0],
+    "rss": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    "qt": any(m.startswith("PyQt6") for m in sys.modules)}}))
+"""
+
+QT_CHILD = """
+import json, resource, sys, time
+t0 = time.perf_counter()
+from types import SimpleNamespace
+from PyQt6.QtCore import QCoreApplication
+from timer_2.clock import Clock
+from timer_2.tunes_defaults import default_model
+imported = time.perf_counter() - t0
+first = []
+app = QCoreApplication(sys.argv)
+clock = Clock({seconds}, SimpleNamespace(model=default_model()))
+clock.beep = lambda: None
+
+def on_draw(seconds):
+    if not first:
+        first.append(time.perf_counter() - t0)
+
+clock.connect("draw_time", on_draw)
+clock.connect("inform_voice", lambda s: None)
+clock.connect("inform_done", app.quit)
+clock.start()
+app.exec()
+print(json.dumps({{"import": imported, "first": first[0],
+    "rss": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    "qt": any(m.startswith("PyQt6") for m in sys.modules)}}))
+"""
+
+
+def run_child(code: str) -> dict[str, float]:
+    env = {**os.environ, "PYTHONPATH": str(SRC), "QT_QPA_PLATFORM": "offscreen"}
+    result = subprocess.run(
+        [sys.executable, "-c", code.format(seconds=COUNTDOWN_SECONDS)],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=env,
+    )
+    data: dict[str, float] = json.loads(result.stdout.strip().splitlines()[-1])
+    return data
+
+
+def main() -> None:
+    print(
+        f"{'вариант':>8} {'импорт, мс':>11} {'1-й такт, мс':>13} "
+        f"{'RSS, МБ':>8} {'Qt':>4}"
+    )
+    for name, code in (("asyncio", ASYNCIO_CHILD), ("Qt", QT_CHILD)):
+        runs = [run_child(code) for _ in range(RUNS)]
+        imported = min(run["import"] for run in runs) * 1000
+        first = min(run["first"] for run in runs) * 1000
+        rss = max(run["rss"] for run in runs) / 1024
+        qt = "да" if runs[0]["qt"] else "нет"
+        print(f"{name:>8} {imported:>11.1f} {first:>13.1f} {rss:>8.1f} {qt:>4}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Загрузка процессора при множестве одновременных таймеров.
+
+Сравниваются два варианта:
+- у каждого Clock свой PreciseTimer/QTimer;
+- все Clock обслуживает один ClockScheduler.
+
+Запуск из корня проекта:
+    python benchmarks/bench_scheduler.py
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from PyQt6.QtCore import QCoreApplication, QEventLoop, QTimer
+
+from timer_2.clock import Clock
+from timer_2.clock_scheduler import ClockScheduler
+from timer_2.tunes_defaults import default_model
+
+COUNTS = (10, 100, 1_000, 5_000)
+WARMUP_MS = 1_500
+MEASURE_MS = 3_000
+
+
+def make_clocks(count: int, scheduler: ClockScheduler | None) -> list[Clock]:
+    settings = SimpleNamespace(model=default_model())
+    clocks = []
+    for _ in range(count):
+        clock = Clock(24 * 3600, settings, scheduler)  # type: ignore[arg-type]
+        clock.connect("draw_time", lambda seconds: None)
+        clock.connect("inform_voice", lambda seconds: None)
+        clock.connect("inform_done", lambda: None)
+        clocks.append(clock)
+    return clocks
+
+
+def run_for(ms: int) -> None:
+    loop = QEventLoop()
+    QTimer.singleShot(ms, loop.quit)
+    loop.exec()
+
+
+def measure(count: int, shared: bool) -> tuple[float, int]:
+    scheduler = ClockScheduler() if shared else None
+    clocks = make_clocks(count, scheduler)
+    for clock in clocks:
+        QTimer.singleShot(random.randrange(1000), clock.start)
+
+    run_for(WARMUP_MS)
+    ticks_before = sum(clock.seconds_left for clock in clocks)
+    wakeups_before = scheduler.wakeups if scheduler else 0
+    cpu_started = time.process_time()
+
+    run_for(MEASURE_MS)
+
+    cpu = time.process_time() - cpu_started
+    ticks = ticks_before - sum(clock.seconds_left for clock in clocks)
+    wakeups = (scheduler.wakeups - wakeups_before) if scheduler else ticks
+
+    for clock in clocks:
+        clock.cancel()
+    return cpu / (MEASURE_MS / 1000) * 100, wakeups
+
+
+def main() -> None:
+    app = QCoreApplication(sys.argv)
+    print(f"{'таймеров':>9} {'вариант':>14} {'CPU, %':>8} {'пробуждений':>12}")
+    for count in COUNTS:
+        for shared in (False, True):
+            cpu_percent, wakeups = measure(count, shared)
+            name = "планировщик" if shared else "свой QTimer"
+            print(f"{count:>9} {name:>14} {cpu_percent:>8.2f} {wakeups:>12}")
+    app.quit()
+
+
+if __name__ == "__main__":
+    main()
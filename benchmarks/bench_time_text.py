@@ -0,0 +1,60 @@
+"""
+Сравнение табличного time_to_text с вызовом num2words на каждое сообщение.
+
+Запуск из корня проекта:
+    python benchmarks/bench_time_text.py
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from timer_2 import time_text as tt
+
+SECONDS_IN_DAY = 86_400
+
+
+def bench(name: str, func: Callable[[int], str]) -> float:
+    started = time.perf_counter()
+    for seconds in range(SECONDS_IN_DAY):
+        func(seconds)
+    elapsed = time.perf_counter() - started
+    print(
+        f"{name:<24} {elapsed * 1000:9.1f} мс за сутки, "
+        f"{elapsed / SECONDS_IN_DAY * 1e6:6.2f} мкс на сообщение"
+    )
+    return elapsed
+
+
+def import_time(module: str) -> float:
+    code = f"import time; t = time.perf_counter(); import {module}; "
+    code += "print(time.perf_counter() - t)"
+    output = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return float(output)
+
+
+def main() -> None:
+    print(f"Импорт num2words: {import_time('num2words') * 1000:.1f} мс")
+
+    started = time.perf_counter()
+    tt.time_to_text(SECONDS_IN_DAY - 1)
+    print(f"Построение таблиц: {(time.perf_counter() - started) * 1000:.1f} мс")
+
+    direct = bench("num2words", tt.time_to_text_num2words)
+    table = bench("таблицы", tt.time_to_text)
+    print(f"Ускорение: {direct / table:.0f}x")
+
+
+if __name__ == "__main__":
+    main()
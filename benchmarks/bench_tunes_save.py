@@ -0,0 +1,82 @@
+"""
+Длительность одного сохранения файла настроек.
+
+Сравниваются:
+- запись на месте (path.write_text, как было раньше);
+- атомарная замена с fsync на каждом сохранении;
+- атомарная замена с fsync не чаще C.TUNES_FSYNC_INTERVAL_MS
+  (как в TunesStorage).
+
+Каждое сохранение меняет одно поле, поэтому пропуск одинаковых
+записей не срабатывает.
+
+Запуск из корня проекта:
+    python benchmarks/bench_tunes_save.py
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from timer_2.const import Const as C
+from timer_2.tick_stats import TickStats
+from timer_2.tunes_mapper import default_dto, dto_to_json_dict
+from timer_2.tunes_storage import TunesStorage
+
+SAVES = 300
+
+
+def measure_in_place(path: Path) -> TickStats:
+    stats = TickStats(SAVES, C.TUNES_SLOW_SAVE_MS)
+    dto = default_dto()
+    for i in range(SAVES):
+        dto.ms_s = i % 60
+        started = time.perf_counter()
+        path.write_text(
+            json.dumps(dto_to_json_dict(dto), ensure_ascii=False, indent=4),
+            encoding="utf-8",
+        )
+        stats.record((time.perf_counter() - started) * 1000)
+    return stats
+
+
+def measure_storage(fsync_interval_ms: int) -> tuple[TickStats, int]:
+    C.TUNES_FSYNC_INTERVAL_MS = fsync_interval_ms  # type: ignore[misc]
+    storage = TunesStorage()
+    storage.load()
+    storage.save_ms = TickStats(SAVES, C.TUNES_SLOW_SAVE_MS)
+    storage.fsyncs = 0
+    dto = default_dto()
+    for i in range(SAVES):
+        dto.ms_s = i % 59 + 1
+        storage.save(dto)
+    storage.flush()
+    return storage.save_ms, storage.fsyncs
+
+
+def row(name: str, stats: TickStats, fsyncs: int | str) -> str:
+    return (
+        f"{name:>28} {stats.percentile(50):>8.3f} {stats.percentile(99):>8.3f} "
+        f"{stats.max():>8.3f} {fsyncs:>7}"
+    )
+
+
+def main() -> None:
+    interval = C.TUNES_FSYNC_INTERVAL_MS
+    with tempfile.TemporaryDirectory() as directory:
+        os.environ["APPDATA"] = directory
+        print(f"{'сохранение, мс':>28} {'p50':>8} {'p99':>8} {'макс':>8} {'fsync':>7}")
+        print(row("запись на месте", measure_in_place(Path(directory) / "x.json"), "-"))
+        print(row("атомарно, fsync каждый раз", *measure_storage(0)))
+        print(row(f"атомарно, fsync раз в {interval} мс", *measure_storage(interval)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+
+@dataclass(slots=True)
+class Announcement:
+    """
+    Голосовое сообщение в очереди.
+
+    deadline — момент (по time.perf_counter), после которого сообщение
+    устарело и произносить его уже бессмысленно.
+    urgent — сообщение финального периода; оно произносится раньше обычных.
+    """
+
+    text: str
+    fragments: tuple[str, ...]
+    queued_at: float
+    deadline: float
+    urgent: bool = False
+
+
+@dataclass(slots=True)
+class QueueStats:
+    """Счётчики очереди голосовых сообщений."""
+
+    queued: int = 0
+    replaced: int = 0
+    dropped_full: int = 0
+    dropped_stale: int = 0
+    late: int = 0
+
+    def summary(self) -> str:
+        return (
+            f"в очереди: {self.queued}, заменено новыми: {self.replaced}, "
+            f"отброшено при переполнении: {self.dropped_full}, "
+            f"устарело: {self.dropped_stale}, с опозданием: {self.late}"
+        )
+
+
+class AnnouncementQueue:
+    """
+    Ограниченная очередь голосовых сообщений со сроком годности.
+
+    Правила:
+    - новое сообщение заменяет ожидающие обычные сообщения
+      (оставшееся время в них уже неактуально);
+    - срочное сообщение заменяет все ожидающие сообщения;
+    - срочные сообщения выдаются раньше обычных;
+    - устаревшие сообщения отбрасываются, не доходя до синтезатора;
+    - сообщение, выданное позже late_ms после постановки, считается опоздавшим.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        late_ms: float,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        self.maxsize = maxsize
+        self.late_ms = late_ms
+        self.clock = clock
+        self.stats = QueueStats()
+        self._items: list[Announcement] = []
+        self._closed = False
+        self._condition = threading.Condition()
+
+    def put(self, announcement: Announcement) -> None:
+        with self._condition:
+            self._drop_stale()
+
+            pending = len(self._items)
+            self._items = [
+                item for item in self._items if item.urgent and not announcement.urgent
+            ]
+            self.stats.replaced += pending - len(self._items)
+
+            if len(self._items) >= self.maxsize:
+                self._items.pop(0)
+                self.stats.dropped_full += 1
+
+            if announcement.urgent:
+                self._items.insert(0, announcement)
+            else:
+                self._items.append(announcement)
+            self.stats.queued += 1
+            self._condition.notify()
+
+    def get(self) -> Announcement | None:
+        """
+        Ждёт и возвращает следующее актуальное сообщение.
+
+        Возвращает None после close().
+        """
+        with self._condition:
+            while True:
+                self._drop_stale()
+                if self._items:
+                    announcement = self._items.pop(0)
+                    break
+                if self._closed:
+                    return None
+                self._condition.wait()
+
+        waited_ms = (self.clock() - announcement.queued_at) * 1000
+        if waited_ms > self.late_ms:
+            self.stats.late += 1
+        return announcement
+
+    def close(self) -> None:
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+
+    def __len__(self) -> int:
+        with self._condition:
+            return len(self._items)
+
+    def _drop_stale(self) -> None:
+        now = self.clock()
+        fresh = [item for item in self._items if item.deadline >= now]
+        self.stats.dropped_stale += len(self._items) - len(fresh)
+        self._items = fresh
@@ -0,0 +1,219 @@
+import io
+import sys
+import threading
+import time
+from array import array
+from collections import OrderedDict
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+sys.stdout = io.StringIO()
+import pygame  # type: ignore
+
+sys.stdout = sys.__stdout__
+
+from .beeps import beep_schedule, render_beeps
+from .const import Const as C
+
+SILENCE_THRESHOLD = 300
+FRAGMENT_GAP_SECONDS = 0.06
+
+_mixer_lock = threading.Lock()
+
+
+def ensure_mixer() -> None:
+    """Инициализирует только микшер pygame, если он ещё не инициализирован."""
+    with _mixer_lock:
+        if not pygame.mixer.get_init():
+            pygame.mixer.init()
+
+
+def play_clip(path: Path) -> None:
+    """
+    Проигрывает звуковой файл через микшер pygame.
+
+    Возвращает управление после окончания звучания, чтобы следующее
+    сообщение не накладывалось на текущее.
+    """
+    ensure_mixer()
+    sound = pygame.mixer.Sound(str(path))
+    sound.play()
+    time.sleep(sound.get_length())
+
+
+class FragmentPlayer:
+    """
+    Склеивает сообщение из заранее синтезированных фрагментов.
+
+    Клипы фрагментов декодируются в PCM один раз и хранятся в памяти.
+    Объём памяти ограничен max_bytes: при превышении вытесняются
+    фрагменты, которые дольше всего не использовались.
+    Тишина в начале и в конце каждого клипа обрезается,
+    чтобы склеенная фраза звучала слитно.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self._pcm: OrderedDict[Path, bytes] = OrderedDict()
+        self._size = 0
+
+    def play(self, clips: list[Path]) -> None:
+        ensure_mixer()
+        frequency, size, channels = pygame.mixer.get_init()
+        frame = abs(size) // 8 * channels
+        gap = bytes(int(frequency * FRAGMENT_GAP_SECONDS) * frame)
+
+        sound = pygame.mixer.Sound(buffer=gap.join(self._load(clip) for clip in clips))
+        sound.play()
+        time.sleep(sound.get_length())
+
+    def _load(self, clip: Path) -> bytes:
+        if (pcm := self._pcm.get(clip)) is not None:
+            self._pcm.move_to_end(clip)
+            return pcm
+
+        raw = pygame.mixer.Sound(str(clip)).get_raw()
+        _, size, channels = pygame.mixer.get_init()
+        pcm = trim_silence(raw, channels) if size == -16 else raw
+
+        self._pcm[clip] = pcm
+        self._size += len(pcm)
+        while self._size > self.max_bytes and len(self._pcm) > 1:
+            _, evicted = self._pcm.popitem(last=False)
+            self._size -= len(evicted)
+
+        return pcm
+
+
+def trim_silence(raw: bytes, channels: int) -> bytes:
+    """
+    Обрезает тишину в начале и в конце 16-битного PCM.
+
+    Граница определяется по первому и последнему отсчёту,
+    модуль которого превышает SILENCE_THRESHOLD, и выравнивается по кадру.
+    """
+    samples = array("h", raw[: len(raw) // 2 * 2])
+    loud = (i for i, sample in enumerate(samples) if abs(sample) > SILENCE_THRESHOLD)
+    if (first := next(loud, None)) is None:
+        return b""
+    last = next(
+        i
+        for i in range(len(samples) - 1, first - 1, -1)
+        if abs(samples[i]) > SILENCE_THRESHOLD
+    )
+
+    start = first // channels * channels
+    stop = (last // channels + 1) * channels
+    return samples[start:stop].tobytes()
+
+
+class MelodyPlayer:
+    """
+    Мелодия окончания таймера, заранее декодированная в память.
+
+    prepare() в фоновом потоке инициализирует микшер и декодирует файл,
+    поэтому ошибки файла обнаруживаются при старте таймера, а в момент
+    окончания остаётся только запустить готовый звук.
+    """
+
+    def __init__(self, on_error: Callable[[Exception], None]) -> None:
+        self.on_error = on_error
+        self.start_latency_ms = 0.0
+        self._started_at = 0.0
+        self._sound: Any = None
+        self._channel: Any = None
+        self._error: Exception | None = None
+        self._thread: threading.Thread | None = None
+
+    def prepare(self, path: Path) -> None:
+        self._sound = None
+        self._error = None
+        self._thread = threading.Thread(
+            target=self._load,
+            args=(path,),
+            name="melody-loader",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def play(self) -> None:
+        """
+        Запускает подготовленную мелодию.
+
+        Если загрузка ещё идёт, дожидается её. Если мелодию подготовить
+        не удалось, поднимает исключение, возникшее при загрузке.
+        """
+        started = time.perf_counter()
+        if self._thread is not None:
+            self._thread.join()
+        if self._error is not None:
+            raise self._error
+        if self._sound is None:
+            raise RuntimeError("Мелодия окончания таймера не подготовлена")
+
+        self._channel = self._sound.play()
+        self._started_at = time.perf_counter()
+        self.start_latency_ms = (self._started_at - started) * 1000
+
+    def is_playing(self) -> bool:
+        return self._channel is not None and self._channel.get_busy()
+
+    def remaining_ms(self) -> int:
+        """Сколько миллисекунд осталось до расчётного окончания мелодии."""
+        if self._sound is None or not self.is_playing():
+            return 0
+        elapsed = time.perf_counter() - self._started_at
+        return max(0, round((self._sound.get_length() - elapsed) * 1000))
+
+    def _load(self, path: Path) -> None:
+        try:
+            ensure_mixer()
+            self._sound = pygame.mixer.Sound(str(path))
+        except Exception as err:
+            self._error = err
+            self.on_error(err)
+
+
+class BeepPlayer:
+    """
+    Сигналы финального периода, собранные в один звуковой буфер.
+
+    Буфер для ожидаемого момента входа в финальный период готовится
+    в фоне при старте таймера. На такте таймера остаётся только
+    запустить его одним вызовом.
+    """
+
+    def __init__(self) -> None:
+        self._key: tuple[int, int, int] | None = None
+        self._sound: Any = None
+        self._lock = threading.Lock()
+
+    def prepare(self, seconds_left: int, period: int, interval: int) -> None:
+        threading.Thread(
+            target=self._render,
+            args=((seconds_left, period, interval),),
+            name="beeps-renderer",
+            daemon=True,
+        ).start()
+
+    def play(self, seconds_left: int, period: int, interval: int) -> None:
+        key = (seconds_left, period, interval)
+        with self._lock:
+            sound = self._sound if self._key == key else None
+        if sound is None:
+            sound = self._render(key)
+        sound.play()
+
+    def _render(self, key: tuple[int, int, int]) -> Any:
+        seconds_left, period, interval = key
+        ensure_mixer()
+        frequency, _, channels = pygame.mixer.get_init()
+        offsets_ms = [
+            (seconds_left - seconds) * C.TIMER_INTERVAL
+            for seconds in beep_schedule(seconds_left, period, interval)
+        ]
+        sound = pygame.mixer.Sound(buffer=render_beeps(offsets_ms, frequency, channels))
+        with self._lock:
+            self._key, self._sound = key, sound
+        return sound
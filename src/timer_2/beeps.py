@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import math
+from array import array
+from functools import cache
+
+TONE_HZ = 880
+TONE_MS = 150
+TONE_VOLUME = 0.5
+FADE_MS = 5
+
+
+def beep_schedule(
+    seconds_left: int,
+    beep_period_in_final: int,
+    beep_interval: int,
+) -> list[int]:
+    """
+    Возвращает остатки времени (не больше seconds_left) для финальных сигналов.
+
+    Сигнал подаётся, когда остаток меньше beep_period_in_final
+    и кратен beep_interval. В момент окончания (0) сигнала нет —
+    звучит мелодия окончания.
+    """
+    first = min(seconds_left, beep_period_in_final - 1)
+    return [s for s in range(first, 0, -1) if s % beep_interval == 0]
+
+
+def render_beeps(offsets_ms: list[int], frequency: int, channels: int) -> bytes:
+    """
+    Рисует все сигналы в один 16-битный PCM-буфер.
+
+    offsets_ms — моменты начала сигналов относительно начала буфера.
+    Сигналы стоят в буфере с точностью до отсчёта, поэтому звучат
+    без дрожания, присущего таймерам Qt.
+    """
+    tone = _tone(frequency, channels)
+    last_start = max(offsets_ms, default=0) * frequency // 1000
+    frame_count = last_start + len(tone) // channels
+    samples = array("h", bytes(frame_count * channels * 2))
+
+    for offset_ms in offsets_ms:
+        start = offset_ms * frequency // 1000 * channels
+        samples[start : start + len(tone)] = tone
+
+    return samples.tobytes()
+
+
+@cache
+def _tone(frequency: int, channels: int) -> array[int]:
+    """Синусоидальный тон с плавным нарастанием и затуханием, без щелчков."""
+    frame_count = TONE_MS * frequency // 1000
+    fade = max(1, FADE_MS * frequency // 1000)
+    amplitude = TONE_VOLUME * 32767
+
+    tone = array("h")
+    for i in range(frame_count):
+        envelope = min(1.0, i / fade, (frame_count - 1 - i) / fade)
+        value = int(
+            amplitude * envelope * math.sin(2 * math.pi * TONE_HZ * i / frequency)
+        )
+        tone.extend([value] * channels)
+    return tone
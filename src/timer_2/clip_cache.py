@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+from collections.abc import Callable
+from contextlib import suppress
+from pathlib import Path
+
+CLIP_SUFFIX = ".wav"
+
+type ClipRenderer = Callable[[Path], None]
+
+
+class ClipCache:
+    """
+    Дисковый кэш синтезированных фраз.
+
+    Каждая фраза хранится отдельным звуковым файлом. Имя файла — хэш
+    от текста, голоса, скорости речи и движка, поэтому смена голоса
+    не приводит к проигрыванию старых записей.
+
+    Общий размер кэша ограничен max_bytes. При превышении удаляются
+    файлы, которые дольше всего не использовались (время изменения файла
+    обновляется при каждом обращении).
+    """
+
+    def __init__(self, cache_dir: Path, max_bytes: int) -> None:
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def clip_key(text: str, voice: str, rate: int, engine: str) -> str:
+        raw = "\x1f".join((engine, voice, str(rate), text))
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+    def path_for(self, key: str) -> Path:
+        return self.cache_dir / f"{key}{CLIP_SUFFIX}"
+
+    def get(self, key: str) -> Path | None:
+        """Возвращает путь к готовому клипу или None, если клипа нет."""
+        path = self.path_for(key)
+        try:
+            os.utime(path)
+        except OSError:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return path
+
+    def put(self, key: str, render: ClipRenderer) -> Path | None:
+        """
+        Синтезирует клип через render и помещает его в кэш.
+
+        render записывает звук во временный файл; в кэш файл попадает
+        только целиком. Временный файл у каждого потока свой, поэтому
+        клипы можно синтезировать из нескольких потоков.
+        Возвращает None, если синтез не удался.
+        """
+        path = self.path_for(key)
+        tmp_path = path.with_suffix(f".{threading.get_ident()}.tmp{CLIP_SUFFIX}")
+
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            render(tmp_path)
+            if tmp_path.stat().st_size == 0:
+                raise OSError(f"Пустой клип: {tmp_path}")
+            os.replace(tmp_path, path)
+        except Exception as err:
+            print(f"Ошибка записи клипа: {type(err).__name__}: {err}")
+            with suppress(OSError):
+                tmp_path.unlink()
+            return None
+
+        self.evict()
+        return path
+
+    def evict(self) -> None:
+        """Удаляет самые старые клипы, пока кэш не уложится в max_bytes."""
+        clips: list[tuple[int, int, Path]] = []
+        for path in self.cache_dir.glob(f"*{CLIP_SUFFIX}"):
+            if path.name.endswith(f".tmp{CLIP_SUFFIX}"):
+                continue
+            with suppress(OSError):
+                stat = path.stat()
+                clips.append((stat.st_mtime_ns, stat.st_size, path))
+
+        total = sum(size for _, size, _ in clips)
+        for _, size, path in sorted(clips):
+            if total <= self.max_bytes:
+                break
+            with suppress(OSError):
+                path.unlink()
+                total -= size
+                self.evictions += 1
@@ -1,49 +1,347 @@
+from __future__ import annotations
+
 from collections.abc import Callable
+from functools import partial
+from math import ceil
+from typing import TYPE_CHECKING, Protocol
 
-from .precise_timer import PreciseTimer
+from .precise_timer import CatchUp, PreciseTimer
 from .const import Const as C
-from .tunes import TunesSettings
-from . import functions as f
+from .time_source import QtTimeSource, TimeSource, TimerHandle
+
+if TYPE_CHECKING:
+    from .clock_scheduler import ClockScheduler
+    from .tunes_model import TunesModel
+
+
+class ClockSettings(Protocol):
+    """Настройки, нужные часам: TunesSettings или любой объект с model."""
+
+    model: TunesModel
+
+
+def system_beep() -> None:
+    from . import functions as f
+
+    f.beep()
+
+
+def fatal_error(title: str, text: str) -> None:
+    from . import functions as f
+
+    f.inform_fatal_error_and_quit(title, text)
 
 
 class Clock:
-    """Управляет отсчётом времени и событиями таймера."""
+    """
+    Управляет отсчётом времени и событиями таймера.
+
+    При запуске запоминается абсолютный момент окончания по монотонным
+    часам, и на каждом такте остаток вычисляется заново. Пропущенные
+    или слитые такты (заблокированный цикл событий, сон компьютера)
+    не сдвигают отсчёт.
+
+    Правила для событий, пропущенных в разрыве:
+    - сигналы и голосовые сообщения из разрыва не воспроизводятся;
+    - после разрыва не короче TIME_JUMP_SECONDS (сон, пробуждение)
+      сразу сообщается текущий остаток;
+    - если время истекло во время разрыва, таймер завершается как обычно.
+
+    В режиме CLOCK_EVENT_DRIVEN часы без планировщика не просыпаются
+    каждую секунду, а спят до ближайшего значимого момента: смены
+    показаний (если окно видно), голосового сообщения, сигнала
+    или окончания. Без этого режима часы с собственным PreciseTimer
+    спят так же, пока окно скрыто, а когда окно снова видно,
+    возобновляют ежесекундные такты.
+
+    В режиме TENTHS_IN_FINAL в финальном периоде при видимом окне
+    показания с десятыми долями секунды обновляются 10 раз в секунду
+    через callback "draw_tenths"; "draw_time" в это время не вызывается.
+    """
 
-    def __init__(self, seconds_left: int, settings: TunesSettings) -> None:
+    def __init__(
+        self,
+        seconds_left: int,
+        settings: ClockSettings,
+        scheduler: ClockScheduler | None = None,
+        time_source: TimeSource | None = None,
+    ) -> None:
+        """
+        scheduler — общий планировщик множества часов. Если он задан,
+        часы не создают собственный таймер, а такты им подаёт планировщик.
+        time_source — источник времени и отложенных вызовов; по умолчанию
+        источник планировщика или реальное время Qt,
+        в тестах — моделируемое (VirtualTimeSource).
+        """
         self.seconds_left = seconds_left
         self.settings = settings
+        self.scheduler = scheduler
+        if time_source is None:
+            time_source = QtTimeSource() if scheduler is None else scheduler.source
+        self.source: TimeSource = time_source
+        self.deadline = self.source.now() + seconds_left
+        self.skipped_seconds = 0
+        self.time_jumps = 0
         self.connections: dict[str, Callable[..., None]] = {}
-        self.timer = PreciseTimer(C.TIMER_INTERVAL, self.on_time_out)
+        self.catch_up = CatchUp(C.TIMER_CATCH_UP)
+        self.event_driven = C.CLOCK_EVENT_DRIVEN and scheduler is None
+        self.timer = (
+            PreciseTimer(C.TIMER_INTERVAL, self.on_time_out, self.catch_up, self.source)
+            if scheduler is None and not self.event_driven
+            else None
+        )
+        self.wakeup: TimerHandle | None = None
+        self.tenths: TimerHandle | None = None
+        self.voice_handles: list[TimerHandle] = []
+        self.visible = True
+        self.running = False
+        self.wakeups = 0
+        self.expected_seconds = seconds_left - 1
+        self.voice_lead_ms: Callable[[], float] = lambda: 0.0
+        self.next_voice_check = seconds_left - 1
+        self.final_beeps_started = False
+        self.beep: Callable[[], None] = system_beep
+        self.on_error: Callable[[str, str], None] = fatal_error
 
     def on_time_out(self) -> None:
-        self.seconds_left -= 1
+        self.wakeups += 1
+        seconds_left = self.remaining_seconds()
+        if seconds_left == 0 and self.remaining_tenths() > 0:
+            # Опоздавший такт не должен закончить отсчёт раньше срока
+            seconds_left = 1
+        if seconds_left >= self.seconds_left:
+            self._arm()
+            return
+
+        skipped = self.expected_seconds - seconds_left
+        self.seconds_left = seconds_left
 
-        self.callback("draw_time", self.seconds_left)
+        self.update_tenths()
+        if not self.tenths_active():
+            self.callback("draw_time", self.seconds_left)
 
         if self.is_end_timer():
+            self.cancel()
             self.callback("inform_done")
             return
 
+        if skipped > 0:
+            self.on_time_gap(skipped)
+
         model = self.settings.model
 
-        if self.seconds_left % model.voice_interval == 0:
+        self.inform_voice_ahead(model.voice_interval)
+
+        if self.seconds_left < model.beep_period_in_final:
+            self.inform_beep(model.beep_interval)
+
+        self._arm()
+
+    def next_event_seconds(self) -> int:
+        """
+        Остаток, при котором часам нужно проснуться в следующий раз.
+
+        Это ближайший из моментов: смена показаний (если окно видно),
+        запуск голосового сообщения с учётом задержки звука,
+        сигнал финального периода, окончание.
+        """
+        model = self.settings.model
+        candidates = [0]
+
+        if self.visible:
+            candidates.append(self.seconds_left - 1)
+
+        voice = self.next_voice_check - self.next_voice_check % model.voice_interval
+        if voice > 0:
+            lead = ceil(self._voice_lead() / C.TIMER_INTERVAL)
+            candidates.append(voice + lead)
+
+        first_beep = min(self.seconds_left - 1, model.beep_period_in_final - 1)
+        if first_beep > 0:
+            if not C.BEEP_RENDERED:
+                candidates.append(first_beep - first_beep % model.beep_interval)
+            elif not self.final_beeps_started:
+                candidates.append(first_beep)
+
+        return min(self.seconds_left - 1, max(candidates))
+
+    def set_visible(self, visible: bool) -> None:
+        """
+        Сообщает, видно ли окно с показаниями.
+
+        Когда окно снова становится видимым, показания сразу обновляются.
+        Часы с PreciseTimer на время, пока окно скрыто, останавливают
+        такты и спят до ближайшего события.
+        """
+        if visible == self.visible:
+            return
+        self.visible = visible
+        self.update_tenths()
+        if not self.running or self.scheduler is not None:
+            return
+
+        if visible:
+            self._wake(0)
+        elif self.timer is not None:
+            self.timer.stop()
+            self._arm()
+
+    def update_tenths(self) -> None:
+        """Включает показ десятых в финальном периоде и выключает вне его."""
+        wanted = (
+            C.TENTHS_IN_FINAL
+            and self.visible
+            and 0 < self.seconds_left < self.settings.model.beep_period_in_final
+        )
+        if wanted == self.tenths_active():
+            return
+
+        if not wanted:
+            if self.tenths is not None:
+                self.tenths.cancel()
+            return
+
+        self.draw_tenths()
+
+    def tenths_active(self) -> bool:
+        return self.tenths is not None and self.tenths.is_active()
+
+    def draw_tenths(self) -> None:
+        """
+        Показывает десятые и планирует следующий показ на границу
+        следующей десятой доли, отсчитанной от момента окончания.
+        """
+        self.callback("draw_tenths", self.remaining_tenths())
+        remaining_ms = (self.deadline - self.source.now()) * 1000
+        delay_ms = remaining_ms % C.TENTHS_INTERVAL
+        if delay_ms < 1:
+            delay_ms += C.TENTHS_INTERVAL
+        if self.tenths is None:
+            self.tenths = self.source.call_later(delay_ms, self.draw_tenths)
+        else:
+            self.tenths.restart(delay_ms)
+
+    def remaining_tenths(self) -> int:
+        """
+        Остаток в десятых долях секунды, с округлением вверх, как на табло.
+
+        Срабатывание таймера до 1 мс раньше границы считается точным.
+        """
+        return max(0, ceil((self.deadline - self.source.now()) * 10 - 0.01))
+
+    def remaining_seconds(self) -> int:
+        """
+        Остаток, округлённый до ближайшей секунды.
+
+        Округление, а не отбрасывание дробной части, делает отсчёт
+        нечувствительным к срабатыванию такта чуть раньше или позже.
+        Окончание определяется не по этому значению, а по remaining_tenths().
+        """
+        return max(0, round(self.deadline - self.source.now()))
+
+    def on_time_gap(self, skipped: int) -> None:
+        """
+        Обрабатывает разрыв в skipped пропущенных секунд.
+
+        Сообщения из разрыва отбрасываются. Вместо них текущий остаток
+        объявляется сразу, если он не будет объявлен по обычному
+        расписанию, в двух случаях:
+        - после большого разрыва (сон, пробуждение);
+        - в режиме CatchUp.COALESCE, если в разрыв попало хотя бы
+          одно сообщение.
+        """
+        voice_interval = self.settings.model.voice_interval
+        missed_voice = self.next_voice_check - self.next_voice_check % voice_interval
+
+        self.skipped_seconds += skipped
+        self.next_voice_check = min(self.next_voice_check, self.seconds_left)
+
+        jump = skipped + 1 >= C.TIME_JUMP_SECONDS
+        if jump:
+            self.time_jumps += 1
+        coalesce = (
+            self.catch_up is CatchUp.COALESCE and missed_voice > self.seconds_left
+        )
+        if not (jump or coalesce):
+            return
+
+        if self.seconds_left % voice_interval != 0:
             self.callback("inform_voice", self.seconds_left)
+            self.next_voice_check = self.seconds_left - 1
+
+    def inform_beep(self, beep_interval: int) -> None:
+        """
+        Сигналы финального периода.
+
+        В режиме BEEP_RENDERED все оставшиеся сигналы проигрываются
+        одним готовым буфером при входе в финальный период.
+        """
+        if not C.BEEP_RENDERED:
+            if self.seconds_left % beep_interval == 0:
+                self.beep()
+            return
+
+        if not self.final_beeps_started:
+            self.final_beeps_started = True
+            self.callback("inform_final_beeps", self.seconds_left)
+
+    def inform_voice_ahead(self, voice_interval: int) -> None:
+        """
+        Запускает голосовые сообщения раньше на измеренную задержку звука.
 
-        if (
-            self.seconds_left < model.beep_period_in_final
-            and self.seconds_left % model.beep_interval == 0
-        ):
-            f.beep()
+        Сообщение о seconds запускается так, чтобы его звук начался,
+        когда на часах будет ровно seconds. next_voice_check помнит,
+        какие остатки уже рассмотрены: при изменении оценки задержки
+        сообщения не повторяются и не теряются.
+        """
+        lead_ms = self._voice_lead()
+        last_due = self.seconds_left - ceil(lead_ms / C.TIMER_INTERVAL)
+
+        for seconds in range(self.next_voice_check, max(last_due, 1) - 1, -1):
+            if seconds % voice_interval != 0:
+                continue
+            delay_ms = (self.seconds_left - seconds) * C.TIMER_INTERVAL - lead_ms
+            if delay_ms <= 0:
+                self.callback("inform_voice", seconds)
+            else:
+                self.voice_handles = [
+                    handle for handle in self.voice_handles if handle.is_active()
+                ]
+                self.voice_handles.append(
+                    self.source.call_later(
+                        delay_ms, partial(self.inform_voice_at, seconds)
+                    )
+                )
+
+        self.next_voice_check = min(self.next_voice_check, last_due - 1)
+
+    def inform_voice_at(self, seconds: int) -> None:
+        """
+        Запускает заранее запланированное сообщение о seconds.
+
+        Если за время ожидания произошёл разрыв и остаток уже меньше
+        seconds, сообщение устарело и отбрасывается.
+        """
+        if self.deadline - self.source.now() >= seconds - 0.5:
+            self.callback("inform_voice", seconds)
+
+    def _voice_lead(self) -> float:
+        return min(max(self.voice_lead_ms(), 0.0), C.VOICE_LEAD_MAX_MS)
+
+    def set_voice_lead(self, voice_lead_ms: Callable[[], float]) -> None:
+        """voice_lead_ms возвращает текущую задержку начала голосового сообщения."""
+        self.voice_lead_ms = voice_lead_ms
 
     def is_end_timer(self) -> bool:
         return self.seconds_left <= 0
 
     def connect(self, name_callback: str, func: Callable[..., None]) -> None:
         if name_callback in self.connections:
-            f.inform_fatal_error_and_quit(
+            self.on_error(
                 C.TITLE_INTERNAL_ERROR,
                 f"{C.TEXT_ERROR_NAME_CALLBACK} {name_callback}",
             )
+            return
         self.connections[name_callback] = func
 
     def callback(self, func_name: str, param: int | None = None) -> None:
@@ -54,10 +352,66 @@ class Clock:
             else:
                 callback(param)
         except Exception as err:
-            f.inform_fatal_error_and_quit(
+            self.on_error(
                 C.TITLE_INTERNAL_ERROR,
                 f"{C.TEXT_ERROR_CALLBACK} {func_name}\n{err}",
             )
 
     def start(self) -> None:
-        self.timer.start()
+        self.deadline = self.source.now() + self.seconds_left
+        self.running = True
+        if self.scheduler is not None:
+            self.scheduler.add(self)
+        elif self._sleeps():
+            self._arm()
+        elif self.timer is not None:
+            self.timer.start()
+
+    def cancel(self) -> None:
+        self.running = False
+        if self.tenths is not None:
+            self.tenths.cancel()
+        for handle in self.voice_handles:
+            handle.cancel()
+        self.voice_handles.clear()
+        if self.scheduler is not None:
+            self.scheduler.cancel(self)
+        if self.wakeup is not None:
+            self.wakeup.cancel()
+        if self.timer is not None:
+            self.timer.stop()
+
+    def _sleeps(self) -> bool:
+        """Часы спят до ближайшего события, а не просыпаются каждую секунду."""
+        return self.event_driven or (self.timer is not None and not self.visible)
+
+    def _arm(self) -> None:
+        """Определяет следующий ожидаемый остаток и, если часы спят, будит к нему."""
+        if not self.running:
+            return
+
+        if not self._sleeps():
+            self.expected_seconds = self.seconds_left - 1
+            if self.timer is not None and not self.timer.is_active():
+                self._resume_ticks()
+            return
+
+        self.expected_seconds = self.next_event_seconds()
+        delay_s = self.deadline - self.expected_seconds - self.source.now()
+        self._wake(delay_s * C.TIMER_INTERVAL)
+
+    def _wake(self, delay_ms: float) -> None:
+        """Будит часы через delay_ms; ожидающее пробуждение переносится."""
+        if self.wakeup is None:
+            self.wakeup = self.source.call_later(max(0.0, delay_ms), self.on_time_out)
+        else:
+            self.wakeup.restart(delay_ms)
+
+    def _resume_ticks(self) -> None:
+        """Возобновляет такты PreciseTimer по сетке секунд до момента окончания."""
+        if self.timer is None:
+            return
+        if self.wakeup is not None:
+            self.wakeup.cancel()
+        remaining_ms = (self.deadline - self.source.now()) * 1000
+        self.timer.start(remaining_ms % C.TIMER_INTERVAL)
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+
+import numpy as np
+import numpy.typing as npt
+
+type FleetCallback = Callable[[int, int], None]
+type IndexArray = npt.NDArray[np.intp]
+
+INITIAL_CAPACITY = 64
+
+
+class ClockFleet:
+    """
+    Множество таймеров в непрерывных массивах NumPy.
+
+    Остаток времени, интервалы и признак активности каждого таймера
+    хранятся в отдельных массивах. Такт tick() одной векторной операцией
+    уменьшает остаток у всех активных таймеров и масками находит
+    таймеры с событиями. Python-код выполняется только для совпадений:
+    на каждое событие вызывается функция обратного вызова
+    с номером таймера и остатком времени.
+
+    Правила событий те же, что у Clock:
+    - голосовое сообщение — остаток кратен voice_interval;
+    - сигнал — остаток меньше beep_period_in_final и кратен beep_interval;
+    - окончание — остаток дошёл до нуля, после чего таймер отключается.
+
+    Номера отменённых и закончившихся таймеров попадают в список
+    свободных и выдаются add() снова, поэтому размер массивов
+    определяется наибольшим числом одновременно работающих таймеров.
+    После отмены или окончания номер таймера использовать нельзя.
+
+    Класс не зависит от Qt: такты подаёт владелец, например PreciseTimer.
+    """
+
+    def __init__(self, capacity: int = INITIAL_CAPACITY) -> None:
+        self.size = 0
+        self.seconds_left = np.zeros(capacity, dtype=np.int64)
+        self.voice_interval = np.ones(capacity, dtype=np.int64)
+        self.beep_interval = np.ones(capacity, dtype=np.int64)
+        self.beep_period = np.zeros(capacity, dtype=np.int64)
+        self.active = np.zeros(capacity, dtype=np.bool_)
+        self.free: list[int] = []
+        self.connections: dict[str, FleetCallback] = {}
+
+    def __len__(self) -> int:
+        return int(np.count_nonzero(self.active[: self.size]))
+
+    def add(
+        self,
+        seconds_left: int,
+        voice_interval: int,
+        beep_interval: int,
+        beep_period_in_final: int,
+    ) -> int:
+        """Добавляет запущенный таймер и возвращает его номер."""
+        if self.free:
+            index = self.free.pop()
+        else:
+            if self.size == len(self.seconds_left):
+                self._grow()
+            index = self.size
+            self.size += 1
+
+        self.seconds_left[index] = seconds_left
+        self.voice_interval[index] = voice_interval
+        self.beep_interval[index] = beep_interval
+        self.beep_period[index] = beep_period_in_final
+        self.active[index] = seconds_left > 0
+        if seconds_left <= 0:
+            self.free.append(index)
+        return index
+
+    def cancel(self, index: int) -> None:
+        if self.active[index]:
+            self.active[index] = False
+            self.free.append(index)
+
+    def connect(self, name_callback: str, func: FleetCallback) -> None:
+        """
+        Назначает обработчик события: "inform_voice", "inform_beep"
+        или "inform_done". Обработчик получает номер таймера и остаток.
+        """
+        self.connections[name_callback] = func
+
+    def tick(self) -> None:
+        """Один такт (секунда) для всех активных таймеров."""
+        size = self.size
+        active = self.active[:size]
+        seconds_left = self.seconds_left[:size]
+
+        seconds_left -= active
+
+        running = active & (seconds_left > 0)
+        done = active & ~running
+        voice = running & (seconds_left % self.voice_interval[:size] == 0)
+        beep = (
+            running
+            & (seconds_left < self.beep_period[:size])
+            & (seconds_left % self.beep_interval[:size] == 0)
+        )
+        active &= running
+
+        finished = np.flatnonzero(done)
+        self._dispatch("inform_voice", np.flatnonzero(voice))
+        self._dispatch("inform_beep", np.flatnonzero(beep))
+        self._dispatch("inform_done", finished)
+        self.free.extend(finished.tolist())
+
+    def _dispatch(self, func_name: str, indexes: IndexArray) -> None:
+        callback = self.connections.get(func_name)
+        if callback is None or not len(indexes):
+            return
+        for index, seconds in zip(
+            indexes.tolist(), self.seconds_left[indexes].tolist()
+        ):
+            callback(index, seconds)
+
+    def _grow(self) -> None:
+        capacity = max(INITIAL_CAPACITY, 2 * len(self.seconds_left))
+        for name in (
+            "seconds_left",
+            "voice_interval",
+            "beep_interval",
+            "beep_period",
+            "active",
+        ):
+            old = getattr(self, name)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[: len(old)] = old
+            setattr(self, name, new)
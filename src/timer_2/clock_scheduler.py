@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from .const import Const as C
+from .time_source import QtTimeSource, TimerHandle, TimeSource
+from .timer_heap import HeapEntry, TimerHeap
+
+if TYPE_CHECKING:
+    from .clock import Clock
+
+
+class ClockScheduler:
+    """
+    Общий планировщик для множества Clock.
+
+    Ближайшие такты всех часов лежат в TimerHeap. Единственный отложенный
+    вызов time_source взводится только на самый ранний такт. Следующий такт часов
+    планируется от расписания, а не от момента срабатывания,
+    поэтому дрейф не накапливается (как в PreciseTimer).
+
+    В entries лежат только записи, которые ещё в куче. Часы, чей такт
+    выполняется сейчас, хранятся в firing, чтобы cancel() из обработчика
+    такта не отменял уже извлечённую из кучи запись.
+
+    Время берётся из time_source: по умолчанию реальное (Qt),
+    в тестах — моделируемое. Сроки в куче — в секундах source.now().
+    """
+
+    def __init__(
+        self,
+        interval_ms: int = C.TIMER_INTERVAL,
+        time_source: TimeSource | None = None,
+    ) -> None:
+        self.interval = interval_ms / 1000
+        self.wakeups = 0
+        self.heap = TimerHeap()
+        self.entries: dict[Clock, HeapEntry] = {}
+        self.firing: dict[Clock, float] = {}
+        self.source: TimeSource = QtTimeSource() if time_source is None else time_source
+        self.handle: TimerHandle | None = None
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def add(self, clock: Clock) -> None:
+        """Запускает часы: первый такт — сразу, как у PreciseTimer.start()."""
+        self.entries[clock] = self.heap.push(self.source.now(), clock)
+        self._arm()
+
+    def cancel(self, clock: Clock) -> None:
+        self.firing.pop(clock, None)
+        entry = self.entries.pop(clock, None)
+        if entry is not None:
+            self.heap.cancel(entry)
+            self._arm()
+
+    def _on_timeout(self) -> None:
+        self.wakeups += 1
+        self.handle = None
+        tolerance = C.SCHEDULER_TOLERANCE_MS / 1000
+
+        for due, _, clock in self.heap.pop_due(self.source.now() + tolerance):
+            del self.entries[clock]
+            self.firing[clock] = due
+
+        for clock, due in list(self.firing.items()):
+            if clock not in self.firing:
+                continue  # отменены тактом других часов
+            clock.on_time_out()
+            cancelled = self.firing.pop(clock, None) is None
+            if cancelled or clock.is_end_timer() or clock in self.entries:
+                continue  # отменены, закончились или добавлены заново
+            self.entries[clock] = self.heap.push(due + self.interval, clock)
+
+        self._arm()
+
+    def _arm(self) -> None:
+        if self.handle is not None:
+            self.handle.cancel()
+            self.handle = None
+        next_due = self.heap.next_due()
+        if next_due is None:
+            return
+        delay_ms = (next_due - self.source.now()) * 1000
+        self.handle = self.source.call_later(max(0.0, delay_ms), self._on_timeout)
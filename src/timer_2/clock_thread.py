@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+
+from PyQt6.QtCore import (
+    QCoreApplication,
+    QObject,
+    Qt,
+    QThread,
+    pyqtSignal,
+    pyqtSlot,
+)
+
+from .clock import Clock
+from .const import Const as C
+from .precise_timer import PreciseTimer
+from .tunes import TunesSettings
+from . import functions as f
+
+
+class ClockWorker(QObject):
+    """
+    Часы в отдельном потоке.
+
+    Clock и его таймеры создаются в run(), уже в потоке работника,
+    поэтому тики не зависят от загрузки потока GUI. События часов
+    превращаются в сигналы; получатели в потоке GUI вызываются
+    через очередь событий. Ошибки часов тоже передаются сигналом error:
+    окно с сообщением можно показывать только из потока GUI.
+    """
+
+    draw_time = pyqtSignal(int)
+    draw_tenths = pyqtSignal(int)
+    inform_voice = pyqtSignal(int)
+    inform_done = pyqtSignal()
+    inform_final_beeps = pyqtSignal(int)
+    beep = pyqtSignal()
+    error = pyqtSignal(str, str)
+
+    def __init__(self, seconds_left: int, settings: TunesSettings) -> None:
+        super().__init__()
+        self.seconds_left = seconds_left
+        self.settings = settings
+        self.voice_lead_ms: Callable[[], float] = lambda: 0.0
+        self.visible = True
+        self.clock: Clock | None = None
+
+    @pyqtSlot()
+    def run(self) -> None:
+        clock = Clock(self.seconds_left, self.settings)
+        clock.connect("draw_time", self.draw_time.emit)
+        clock.connect("draw_tenths", self.draw_tenths.emit)
+        clock.connect("inform_voice", self.inform_voice.emit)
+        clock.connect("inform_done", self._on_done)
+        clock.connect("inform_final_beeps", self.inform_final_beeps.emit)
+        clock.beep = self.beep.emit
+        clock.on_error = self.error.emit
+        clock.set_voice_lead(self.voice_lead_ms)
+        clock.set_visible(self.visible)
+        self.clock = clock
+        clock.start()
+
+    @pyqtSlot(bool)
+    def set_visible(self, visible: bool) -> None:
+        self.visible = visible
+        if self.clock is not None:
+            self.clock.set_visible(visible)
+
+    @pyqtSlot()
+    def stop(self) -> None:
+        if self.clock is not None:
+            self.clock.cancel()
+        thread = self.thread()
+        if thread is not None:
+            thread.quit()
+
+    def _on_done(self) -> None:
+        self.inform_done.emit()
+        self.stop()
+
+
+class ClockThread(QObject):
+    """
+    Обёртка над ClockWorker с интерфейсом Clock для потока GUI.
+
+    connect() подключает обработчик к сигналу работника очередным
+    соединением: обработчик выполняется в потоке GUI.
+    """
+
+    _visibility_changed = pyqtSignal(bool)
+    _stop_requested = pyqtSignal()
+
+    def __init__(self, seconds_left: int, settings: TunesSettings) -> None:
+        super().__init__()
+        self.worker_thread = QThread()
+        self.worker = ClockWorker(seconds_left, settings)
+        self.worker.moveToThread(self.worker_thread)
+        self.worker_thread.started.connect(self.worker.run)
+        self._visibility_changed.connect(self.worker.set_visible)
+        self._stop_requested.connect(self.worker.stop)
+        self.worker.beep.connect(f.beep)
+        self.worker.error.connect(self._on_error)
+
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.cancel)
+
+    @property
+    def timer(self) -> PreciseTimer | None:
+        clock = self.worker.clock
+        return clock.timer if clock is not None else None
+
+    def connect(self, name_callback: str, func: Callable[..., None]) -> None:
+        signal = getattr(self.worker, name_callback, None)
+        if signal is None:
+            f.inform_fatal_error_and_quit(
+                C.TITLE_INTERNAL_ERROR,
+                f"{C.TEXT_ERROR_NAME_CALLBACK} {name_callback}",
+            )
+        signal.connect(func, Qt.ConnectionType.QueuedConnection)
+
+    def set_voice_lead(self, voice_lead_ms: Callable[[], float]) -> None:
+        """Вызывается до start(); voice_lead_ms должна быть потокобезопасной."""
+        self.worker.voice_lead_ms = voice_lead_ms
+
+    def set_visible(self, visible: bool) -> None:
+        if self.worker_thread.isRunning():
+            self._visibility_changed.emit(visible)
+        else:
+            self.worker.visible = visible
+
+    def start(self) -> None:
+        self.worker_thread.start(QThread.Priority.TimeCriticalPriority)
+
+    def cancel(self) -> None:
+        if self.worker_thread.isRunning():
+            self._stop_requested.emit()
+            self.worker_thread.wait(C.CLOCK_THREAD_STOP_MS)
+
+    @pyqtSlot(str, str)
+    def _on_error(self, title: str, text: str) -> None:
+        """Выполняется в потоке GUI: ClockThread живёт в нём."""
+        f.inform_fatal_error_and_quit(title, text)
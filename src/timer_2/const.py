@@ -6,24 +6,47 @@ class Const:
     """Константы программы. Настройки пользователя здесь не хранятся."""
 
     ACTIVE_FIELD_BG_COLOR = "QLineEdit { background-color: #f5ffb3; }"
+    # Проигрывать сигналы финального периода одним заранее собранным буфером
+    # вместо системного сигнала на каждом такте.
+    BEEP_RENDERED = False
+    CLIP_CACHE_DIR = "clips"
+    CLIP_CACHE_MAX_BYTES = 20 * 1024 * 1024
+    # Часы без планировщика спят до ближайшего значимого события
+    # вместо пробуждения каждую секунду. Без этого режима часы спят
+    # так только пока окно скрыто.
+    CLOCK_EVENT_DRIVEN = False
+    # Часы работают в отдельном потоке и передают события GUI через очередь.
+    CLOCK_THREAD = False
+    CLOCK_THREAD_STOP_MS = 2000
     END_CHECK_INTERVAL = 100
     FILE_TUNES_0 = "../../tunes.json"
 
     FORMS_HOUR = ["часов", "час", "часа"]
     FORMS_MINUTE = ["минут", "минута", "минуты"]
     FORMS_SECUNDA = ["секунд", "секунда", "секунды"]
+    FRAGMENTS_MAX_BYTES = 16 * 1024 * 1024
     GENDER_F = "f"
     GENDER_M = "m"
     INACTIVE_FIELD_BG_COLOR = "QLineEdit { background-color: white; }"
     JSON = "json"
     LANG_RU = "ru"
 
+    PRESYNTH_AHEAD = 12
+    PRESYNTH_WORKERS = 2
+
     RE_PATTERN_0_24 = r"[0-9]|1[0-9]|2[0-3]"
     RE_PATTERN_0_60 = r"[0-5][0-9]"
 
+    SCHEDULER_TOLERANCE_MS = 5
+
     SECONDS_IN_HOUR = 3600
     SECONDS_IN_MINUTE = 60
 
+    # Показывать десятые доли секунды в финальном периоде (10 Гц),
+    # пока окно видно. Вне финального периода показ раз в секунду.
+    TENTHS_IN_FINAL = False
+    TENTHS_INTERVAL = 100
+
     TEXT_ERROR_CALLBACK = "Класс Clock. Неверно указана функция callback - "
     TEXT_ERROR_NAME_CALLBACK = (
         "Класс Clock. Функция callback регистрируется повторно - "
@@ -44,10 +67,30 @@ class Const:
     TEXT_NO_MELODY = "Не задана мелодия окончания таймера"
     TEXT_NO_PLAY_MELODY = "Ошибка при инициализации/использовании проигрывателя музыки"
 
+    # Показывать поверх главного окна статистику опозданий тактов.
+    TICK_STATS_OVERLAY = False
+    TICK_STATS_OVERLAY_STYLE = "QLabel { background-color: #c0ffffe0; font-size: 8pt; }"
+    TICK_STATS_SIZE = 3600
+    # Разрыв между тактами (в секундах), после которого считается, что
+    # компьютер спал, и текущий остаток объявляется сразу.
+    TIME_JUMP_SECONDS = 3
     TIMER_2_UI = "_internal/timer_2.ui"
+    # Поведение PreciseTimer после задержки цикла событий:
+    # "burst", "skip" или "coalesce" (см. precise_timer.CatchUp).
+    TIMER_CATCH_UP = "coalesce"
     TIMER_INTERVAL = 1000
+    # Задержка отложенного сохранения настроек: изменения за это время
+    # записываются одной записью в фоновом потоке. 0 — сохранять сразу.
+    TUNES_SAVE_DELAY_MS = 500
+    # Не чаще одного fsync файла настроек за этот интервал;
+    # остальное досинхронизируется при выходе (TunesStorage.flush).
+    TUNES_FSYNC_INTERVAL_MS = 2000
+    TUNES_PROFILE_CACHE_SIZE = 8
+    TUNES_SAVE_STATS_SIZE = 256
+    TUNES_SLOW_SAVE_MS = 100
     TUNES_UI = "_internal/tunes.ui"
 
+    TITLE_ERROR_MELODY = "Ошибка мелодии окончания таймера"
     TITLE_ERROR_READ = "Ошибка при вводе файла настроек"
     TITLE_ERROR_SPEACH = "Инициализация синтезатора речи"
     TITLE_ERROR_TUNE = "Ошибка настройки"
@@ -59,3 +102,12 @@ class Const:
 
     TYPES_FILE_MELODY = "*.mp3"
     TYPES_FILE_TUNES = f"JSON файлы (*.{JSON})"
+
+    # Склеивать голосовые сообщения из заранее синтезированных фрагментов
+    # («двадцать две» + «секунды») вместо синтеза целых фраз.
+    VOICE_FRAGMENTS = False
+    VOICE_LATE_MS = 500
+    VOICE_LATENCY_SMOOTHING = 0.3
+    VOICE_LEAD_MAX_MS = 3000
+    VOICE_MAX_DELAY_MS = 1500
+    VOICE_QUEUE_SIZE = 2
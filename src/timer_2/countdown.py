@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from .clock import Clock
+from .time_source import AsyncioTimeSource
+from .tunes_model import TunesModel
+
+
+@dataclass(slots=True)
+class HeadlessSettings:
+    """Настройки часов без окна настроек: только модель."""
+
+    model: TunesModel
+
+
+class CountdownEngine:
+    """
+    Обратный отсчёт на asyncio, без Qt.
+
+    Та же логика Clock (монотонный момент окончания, компенсация
+    дрейфа, правила для разрывов) работает на AsyncioTimeSource,
+    поэтому отсчёт можно вести в процессе без GUI. События те же,
+    что у Clock и ClockWorker: "draw_time", "draw_tenths",
+    "inform_voice", "inform_final_beeps", "inform_done" и "beep".
+    Неподключённые события игнорируются.
+
+    Ошибки обработчиков не показываются в QMessageBox, а завершают
+    run() исключением RuntimeError.
+    """
+
+    def __init__(
+        self,
+        seconds_left: int,
+        model: TunesModel,
+        loop: asyncio.AbstractEventLoop | None = None,
+    ) -> None:
+        """loop — цикл событий; по умолчанию текущий работающий цикл."""
+        self.source = AsyncioTimeSource(loop)
+        self.done: asyncio.Future[None] = self.source.loop.create_future()
+        self.on_done: Callable[[], None] = lambda: None
+        self.clock = Clock(
+            seconds_left, HeadlessSettings(model), time_source=self.source
+        )
+        self.clock.on_error = self._on_error
+        self.clock.beep = lambda: None
+        self.clock.connect("inform_done", self._on_done)
+
+    def connect(self, name_callback: str, func: Callable[..., None]) -> None:
+        if name_callback == "beep":
+            self.clock.beep = func
+        elif name_callback == "inform_done":
+            self.on_done = func
+        else:
+            self.clock.connect(name_callback, func)
+
+    def set_voice_lead(self, voice_lead_ms: Callable[[], float]) -> None:
+        self.clock.set_voice_lead(voice_lead_ms)
+
+    def set_visible(self, visible: bool) -> None:
+        self.clock.set_visible(visible)
+
+    async def run(self) -> None:
+        """Запускает отсчёт и ждёт его окончания; отмена задачи останавливает часы."""
+        for name in ("draw_time", "draw_tenths", "inform_voice", "inform_final_beeps"):
+            self.clock.connections.setdefault(name, _ignore)
+        self.clock.start()
+        try:
+            await self.done
+        finally:
+            self.clock.cancel()
+
+    def cancel(self) -> None:
+        self.clock.cancel()
+        self.done.cancel()
+
+    def _on_done(self) -> None:
+        self.on_done()
+        if not self.done.done():
+            self.done.set_result(None)
+
+    def _on_error(self, title: str, text: str) -> None:
+        self.clock.cancel()
+        if not self.done.done():
+            self.done.set_exception(RuntimeError(f"{title}: {text}"))
+
+
+def _ignore(*args: int) -> None:
+    pass
@@ -1,20 +1,15 @@
-import io
-import sys
-import threading
-from contextlib import suppress
-
-from pyttsx3.engine import Engine
-import pyttsx3  # type: ignore
-from PyQt6.QtCore import QEventLoop, QTimer
-
-sys.stdout = io.StringIO()
-import pygame  # type: ignore
-
-sys.stdout = sys.__stdout__
+from PyQt6.QtCore import QEventLoop, Qt, QTimer
+from PyQt6.QtWidgets import QMessageBox
 
 from . import functions as f
+from . import time_text as tt
+from .announcement_queue import QueueStats
+from .audio import BeepPlayer, FragmentPlayer, MelodyPlayer, play_clip
+from .clip_cache import ClipCache
 from .const import Const as C
+from .presynth import PreSynthesizer, announcement_schedule
 from .signals import signals
+from .speech import SpeechStats, SpeechWorker
 from .tunes import TunesSettings
 
 
@@ -23,67 +18,130 @@ class InformTime:
 
     def __init__(self, settings: TunesSettings) -> None:
         self.settings = settings
-        self.voice_lock = threading.Lock()
-
-    def inform_voice(self, seconds: int) -> None:
+        clip_cache = ClipCache(
+            f.get_app_settings_dir() / C.CLIP_CACHE_DIR,
+            max_bytes=C.CLIP_CACHE_MAX_BYTES,
+        )
+        fragment_player = FragmentPlayer(max_bytes=C.FRAGMENTS_MAX_BYTES)
+        self.presynth = PreSynthesizer(
+            clip_cache,
+            workers=C.PRESYNTH_WORKERS,
+            ahead=C.PRESYNTH_AHEAD,
+        )
+        self.speech = SpeechWorker(
+            clip_cache=clip_cache,
+            play_clip=play_clip,
+            play_fragments=fragment_player.play if C.VOICE_FRAGMENTS else None,
+            request_clips=self.presynth.request,
+        )
+        self.speech.start()
+        self.melody = MelodyPlayer(on_error=self._on_melody_error)
+        self.final_beeps = BeepPlayer()
+        signals.melody_load_failed.connect(self._warn_melody_error)
+        if C.VOICE_FRAGMENTS:
+            self._prepare_fragments()
+
+    @property
+    def speech_stats(self) -> SpeechStats:
+        return self.speech.stats
+
+    @property
+    def voice_queue_stats(self) -> QueueStats:
+        return self.speech.queue_stats
+
+    def voice_latency_ms(self) -> float:
+        """Скользящая оценка задержки от запуска сообщения до начала звука."""
+        return self.speech.stats.latency_ms
+
+    def prepare(self, seconds_left: int) -> None:
         """
-        Запускает голосовое сообщение в отдельном потоке.
+        Запускает фоновый синтез сообщений, которые прозвучат за время отсчёта.
 
-        Для каждого сообщения создаётся отдельный pyttsx3 engine.
-        Это устойчивее, чем многократно использовать один общий engine.
-        """
-        thread = threading.Thread(
-            target=self._voice_once,
-            args=(seconds,),
-            daemon=True,
-        )
-        thread.start()
+        Вызывается при старте таймера: к моменту сообщения его клип
+        уже лежит в кэше, и на такте таймера синтез не выполняется.
+        В режиме склейки все фрагменты уже синтезированы при запуске программы.
 
-    def _voice_once(self, seconds: int) -> None:
+        Здесь же в фоне готовятся мелодия окончания таймера
+        и буфер сигналов финального периода.
         """
-        Однократно произносит остаток времени.
+        self.prepare_melody()
+        if C.BEEP_RENDERED:
+            model = self.settings.model
+            self.final_beeps.prepare(
+                min(seconds_left - 1, model.beep_period_in_final - 1),
+                model.beep_period_in_final,
+                model.beep_interval,
+            )
 
-        Если предыдущее голосовое сообщение ещё не закончилось,
-        новое сообщение пропускается.
-        """
-        if not self.voice_lock.acquire(blocking=False):
+        if C.VOICE_FRAGMENTS:
             return
 
-        voice_engine: Engine | None = None
+        schedule = announcement_schedule(
+            seconds_left,
+            self.settings.model.voice_interval,
+        )
+        self.presynth.start([tt.time_to_text(seconds) for seconds in schedule])
 
-        try:
-            text = f.time_to_text(seconds)
+    def inform_voice(self, seconds: int) -> None:
+        """
+        Передаёт голосовое сообщение долгоживущему потоку синтеза речи.
 
-            engine = pyttsx3.init()
-            if engine is None:
-                raise RuntimeError("pyttsx3.init() вернул None")
+        Движок pyttsx3 создаётся один раз, а не для каждого сообщения.
+        Уже синтезированные фразы проигрываются из дискового кэша клипов.
 
-            voice_engine = engine
-            engine.say(text)
-            engine.runAndWait()
+        Сообщение, которое не удалось начать до следующего сообщения
+        (и не позже VOICE_MAX_DELAY_MS), не произносится.
+        Сообщения финального периода произносятся в первую очередь.
+        """
+        model = self.settings.model
+        fragments = tt.time_to_fragments(seconds) if C.VOICE_FRAGMENTS else None
+        self.speech.say(
+            tt.time_to_text(seconds),
+            fragments,
+            max_delay_ms=min(
+                C.VOICE_MAX_DELAY_MS,
+                model.voice_interval * C.TIMER_INTERVAL,
+            ),
+            urgent=seconds < model.beep_period_in_final,
+        )
+        if not C.VOICE_FRAGMENTS:
+            self.presynth.advance()
+
+    def inform_final_beeps(self, seconds_left: int) -> None:
+        """Проигрывает все оставшиеся сигналы финального периода одним буфером."""
+        model = self.settings.model
+        self.final_beeps.play(
+            seconds_left,
+            model.beep_period_in_final,
+            model.beep_interval,
+        )
 
-        except Exception as err:
-            print(f"Ошибка голосового сообщения: {type(err).__name__}: {err}")
+    def _prepare_fragments(self) -> None:
+        """
+        Синтезирует в фоне все фрагменты, из которых склеиваются сообщения.
 
-        finally:
-            if voice_engine is not None:
-                with suppress(Exception):
-                    voice_engine.stop()
+        Фрагментов меньше сотни, и они покрывают любое время в пределах суток.
+        """
+        fragments = tt.all_time_fragments()
+        self.presynth.start(fragments)
+        self.presynth.advance(len(fragments))
 
-            self.voice_lock.release()
+    def prepare_melody(self) -> None:
+        """
+        Инициализирует микшер и декодирует мелодию окончания в фоне.
 
-    def inform_done(self) -> None:
+        Ошибка файла мелодии показывается сразу, а не в конце отсчёта.
+        """
         file_melody = self.settings.model.file_melody
 
         if not file_melody:
             f.inform_fatal_error_and_quit(C.TITLE_NO_MELODY, C.TEXT_NO_MELODY)
-        melody_path = f.resource_path(file_melody)
-        try:
-            pygame.init()
-            pygame.mixer.init()
-            pygame.mixer.music.load(melody_path)
-            pygame.mixer.music.play()
+        self.melody.prepare(f.resource_path(file_melody))
 
+    def inform_done(self) -> None:
+        self.presynth.stop()
+        try:
+            self.melody.play()
         except Exception as err:
             f.inform_fatal_error_and_quit(
                 C.TITLE_INTERNAL_ERROR,
@@ -93,13 +151,44 @@ class InformTime:
         self.control_end_of_melody()
         f.go_quit()
 
-    # noinspection PyArgumentList,PyUnresolvedReferences
     @staticmethod
-    def control_end_of_melody() -> None:
-        timer = QTimer()
-        timer.timeout.connect(f.check_music_finished)
-        timer.start(C.END_CHECK_INTERVAL)
+    def _on_melody_error(err: Exception) -> None:
+        """Вызывается из потока загрузки: сообщение передаётся в GUI-поток."""
+        signals.melody_load_failed.emit(str(err))
+
+    @staticmethod
+    def _warn_melody_error(text: str) -> None:
+        QMessageBox.warning(
+            None,
+            C.TITLE_ERROR_MELODY,
+            f"{C.TEXT_NO_PLAY_MELODY}\n{text}",
+        )
 
+    def check_melody_finished(self) -> None:
+        """
+        Проверяет окончание мелодии в момент, когда она должна закончиться.
+
+        Если устройство ещё доигрывает хвост буфера, проверка повторяется
+        один раз через END_CHECK_INTERVAL, а не по постоянному таймеру.
+        """
+        if self.melody.is_playing():
+            QTimer.singleShot(C.END_CHECK_INTERVAL, self.check_melody_finished)
+            return
+        signals.melody_finished.emit()
+
+    # noinspection PyArgumentList,PyUnresolvedReferences
+    def control_end_of_melody(self) -> None:
+        """
+        Ждёт окончания мелодии без периодического опроса микшера.
+
+        Длительность декодированной мелодии известна, поэтому достаточно
+        одного срабатывания таймера в расчётный момент окончания.
+        """
         loop = QEventLoop()
         signals.melody_finished.connect(loop.quit)
+        QTimer.singleShot(
+            self.melody.remaining_ms(),
+            Qt.TimerType.PreciseTimer,
+            self.check_melody_finished,
+        )
         loop.exec()
@@ -9,8 +9,8 @@ import pygame  # type: ignore
 sys.stdout = sys.__stdout__
 
 from PyQt6 import uic  # type: ignore
-from PyQt6.QtCore import QRegularExpression
-from PyQt6.QtGui import QRegularExpressionValidator
+from PyQt6.QtCore import QEvent, QRegularExpression, Qt
+from PyQt6.QtGui import QHideEvent, QRegularExpressionValidator, QShowEvent
 from PyQt6.QtWidgets import (
     QApplication,
     QLabel,
@@ -21,9 +21,11 @@ from PyQt6.QtWidgets import (
 )
 
 from .clock import Clock
+from .clock_thread import ClockThread
 from .const import Const as C
 from . import functions as f
 from .inform import InformTime
+from .time_text import hour_minutes_sec
 from .tune_key import TuneKey
 from .tunes import TunesSettings, TunesWindow
 
@@ -42,6 +44,7 @@ class Timer2(QMainWindow):
     btnStart: QPushButton
     btnTunes: QPushButton
     lblSec: QLabel
+    lblTenths: QLabel
     lineEdit_HM_H: QLineEdit
     lineEdit_HM_M: QLineEdit
     lineEdit_MS_M: QLineEdit
@@ -52,9 +55,12 @@ class Timer2(QMainWindow):
         uic.loadUi(str(f.resource_path(C.TIMER_2_UI)), self)
 
         self.settings = TunesSettings()
-        self.clock: Clock | None = None
+        self.clock: Clock | ClockThread | None = None
         self.inform_time = InformTime(self.settings)
         self.tunes_window: TunesWindow | None = None
+        self.tick_stats_label = (
+            self.create_tick_stats_overlay() if C.TICK_STATS_OVERLAY else None
+        )
 
         self.validator_hour = QRegularExpressionValidator()
         self.validator_min_sec = QRegularExpressionValidator()
@@ -108,6 +114,7 @@ class Timer2(QMainWindow):
 
     def init_vars(self) -> None:
         self.lblSec.setText("")
+        self.lblTenths.setText("")
         if self.settings.model.restore_time:
             self.initialize_time_fields()
 
@@ -127,13 +134,22 @@ class Timer2(QMainWindow):
         if self.clock is not None or seconds_left <= 0:
             return
 
-        self.clock = Clock(seconds_left, self.settings)
+        self.clock = (
+            ClockThread(seconds_left, self.settings)
+            if C.CLOCK_THREAD
+            else Clock(seconds_left, self.settings)
+        )
         if self.clock is None:
             return
 
         self.clock.connect("draw_time", self.draw_time)
+        self.clock.connect("draw_tenths", self.draw_tenths)
         self.clock.connect("inform_voice", self.inform_time.inform_voice)
         self.clock.connect("inform_done", self.inform_time.inform_done)
+        self.clock.connect("inform_final_beeps", self.inform_time.inform_final_beeps)
+        self.clock.set_voice_lead(self.inform_time.voice_latency_ms)
+        self.update_clock_visibility()
+        self.inform_time.prepare(seconds_left)
         self.clock.start()
         self.btnStart.setDisabled(True)
         f.beep()
@@ -148,8 +164,26 @@ class Timer2(QMainWindow):
         self.tunes_window.refresh_ui()
         self.tunes_window.show()
 
+    def changeEvent(self, event: QEvent | None) -> None:
+        super().changeEvent(event)
+        if event is not None and event.type() == QEvent.Type.WindowStateChange:
+            self.update_clock_visibility()
+
+    def showEvent(self, event: QShowEvent | None) -> None:
+        super().showEvent(event)
+        self.update_clock_visibility()
+
+    def hideEvent(self, event: QHideEvent | None) -> None:
+        super().hideEvent(event)
+        self.update_clock_visibility()
+
+    def update_clock_visibility(self) -> None:
+        """Свёрнутому или скрытому окну не нужно обновлять показания каждую секунду."""
+        if self.clock is not None:
+            self.clock.set_visible(self.isVisible() and not self.isMinimized())
+
     def draw_time(self, seconds_left: int) -> None:
-        hour, minutes, sec = f.hour_minutes_sec(seconds_left)
+        hour, minutes, sec = hour_minutes_sec(seconds_left)
 
         match self.active_time_field():
             case TimeField.MS:
@@ -159,6 +193,41 @@ class Timer2(QMainWindow):
             case None:
                 pass
 
+        self.draw_tick_stats()
+
+    def draw_tenths(self, tenths: int) -> None:
+        seconds, tenth = divmod(tenths, 10)
+        self.draw_time(seconds)
+
+        match self.active_time_field():
+            case TimeField.MS:
+                self.lblTenths.setText(f".{tenth}")
+            case TimeField.HM:
+                self.lblSec.setText(f"{self.lblSec.text()}.{tenth}")
+            case None:
+                pass
+
+    def create_tick_stats_overlay(self) -> QLabel:
+        """Отладочная надпись со статистикой опозданий тактов поверх окна."""
+        label = QLabel(self)
+        label.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents)
+        label.setStyleSheet(C.TICK_STATS_OVERLAY_STYLE)
+        label.setWordWrap(True)
+        label.setFixedWidth(self.width())
+        label.hide()
+        return label
+
+    def draw_tick_stats(self) -> None:
+        if self.tick_stats_label is None or self.clock is None:
+            return
+        if self.clock.timer is None:
+            return
+
+        self.tick_stats_label.setText(self.clock.timer.stats.summary())
+        self.tick_stats_label.adjustSize()
+        self.tick_stats_label.show()
+        self.tick_stats_label.raise_()
+
     def draw_hour_min(self, hour: int, minutes: int, sec: int) -> None:
         self.lineEdit_HM_H.setText(f"{hour:02}")
         self.lineEdit_HM_M.setText(f"{minutes:02}")
@@ -167,6 +236,7 @@ class Timer2(QMainWindow):
     def draw_min_sec(self, minutes: int, sec: int) -> None:
         self.lineEdit_MS_M.setText(f"{minutes:02}")
         self.lineEdit_MS_S.setText(f"{sec:02}")
+        self.lblTenths.setText("")
 
     def get_seconds_left(self) -> int:
         match self.active_time_field():
@@ -232,17 +302,18 @@ class Timer2(QMainWindow):
         self.set_tunes_and_finish(widget, focus)
 
     def set_tunes_and_finish(self, widget: QLineEdit, focus: QWidget) -> None:
-        self.put_int_tune(TuneKey.HM_H, self.lineEdit_HM_H.text())
-        self.put_int_tune(TuneKey.HM_M, self.lineEdit_HM_M.text())
-        self.put_int_tune(TuneKey.MS_M, self.lineEdit_MS_M.text())
-        self.put_int_tune(TuneKey.MS_S, self.lineEdit_MS_S.text())
+        self.settings.set_many(
+            {
+                TuneKey.HM_H: self.lineEdit_HM_H.text() or 0,
+                TuneKey.HM_M: self.lineEdit_HM_M.text() or 0,
+                TuneKey.MS_M: self.lineEdit_MS_M.text() or 0,
+                TuneKey.MS_S: self.lineEdit_MS_S.text() or 0,
+            }
+        )
 
         if len(widget.text()) == 2:
             focus.setFocus()
 
-    def put_int_tune(self, key: TuneKey, value: str) -> None:
-        self.settings.set_value(key, value if value else 0)
-
     @staticmethod
     def activate_inactivate_widgets(
         active_1: QLineEdit,
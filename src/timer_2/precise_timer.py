@@ -1,32 +1,79 @@
 from collections.abc import Callable
+from enum import Enum
 
-from PyQt6.QtCore import QElapsedTimer, QTimer
+from .const import Const as C
+from .tick_stats import TickStats
+from .time_source import QtTimeSource, TimeSource, TimerHandle
+
+
+class CatchUp(Enum):
+    """Что делать с тактами, пропущенными, пока цикл событий был занят."""
+
+    BURST = "burst"  # выдать все пропущенные такты подряд
+    SKIP = "skip"  # выдать один такт и перейти к текущему моменту
+    COALESCE = "coalesce"  # как SKIP; часы дополнительно сообщают остаток
 
 
 class PreciseTimer:
-    """Точный таймер. Похож на QTimer, но компенсирует накопленный дрейф."""
+    """
+    Точный таймер. Похож на QTimer, но компенсирует накопленный дрейф.
+
+    Первый такт выдаётся сразу после start(), следующие — по сетке
+    с шагом interval от момента запуска. Если цикл событий был занят
+    дольше интервала, поведение определяет catch_up. coalesced_ticks
+    считает такты, слитые с другими. Опоздание каждого такта
+    относительно сетки записывается в stats.
+
+    Время берётся из time_source: по умолчанию реальное (Qt),
+    в тестах — моделируемое.
+    """
 
-    def __init__(self, interval_ms: int, callback: Callable[[], None]) -> None:
+    def __init__(
+        self,
+        interval_ms: int,
+        callback: Callable[[], None],
+        catch_up: CatchUp = CatchUp(C.TIMER_CATCH_UP),
+        time_source: TimeSource | None = None,
+    ) -> None:
         self.interval = interval_ms
         self.callback = callback
-        self.elapsed = QElapsedTimer()
-        self.timer = QTimer()
-        self.timer.setSingleShot(True)
-        self.timer.setInterval(self.interval)
-        self.timer.timeout.connect(self._on_timeout)
+        self.catch_up = catch_up
+        self.source: TimeSource = QtTimeSource() if time_source is None else time_source
+        self.handle: TimerHandle | None = None
+        self.started_at = 0.0
         self.tick_count = 0
+        self.coalesced_ticks = 0
+        self.stats = TickStats(C.TICK_STATS_SIZE, interval_ms)
 
-    def start(self) -> None:
-        self.elapsed.start()
-        self.timer.start(0)
+    def start(self, delay_ms: float = 0) -> None:
+        """Запускает такты; первый такт — через delay_ms, по умолчанию сразу."""
+        self.started_at = self.source.now() + delay_ms / 1000
+        self.tick_count = 0
+        self.handle = self.source.call_later(delay_ms, self._on_timeout)
+
+    def stop(self) -> None:
+        if self.handle is not None:
+            self.handle.cancel()
+        self.handle = None
+
+    def is_active(self) -> bool:
+        return self.handle is not None
 
     def _on_timeout(self) -> None:
         self.tick_count += 1
-        now = self.elapsed.elapsed()
-        expected_time = self.tick_count * self.interval
+        now = (self.source.now() - self.started_at) * 1000
+        expected_time = (self.tick_count - 1) * self.interval
         drift = now - expected_time
+        self.stats.record(drift)
+
+        if drift >= self.interval and self.catch_up is not CatchUp.BURST:
+            missed = int(drift // self.interval)
+            self.tick_count += missed
+            self.coalesced_ticks += missed
+            drift -= missed * self.interval
 
         self.callback()
 
-        next_delay = max(0, self.interval - drift)
-        self.timer.start(next_delay)
+        if self.handle is not None:
+            next_delay = max(0, self.interval - drift)
+            self.handle = self.source.call_later(next_delay, self._on_timeout)
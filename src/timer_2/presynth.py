@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from .clip_cache import ClipCache
+from .speech import EngineFactory, create_engine, engine_clip_key, render_clip
+
+
+def announcement_schedule(seconds_left: int, voice_interval: int) -> list[int]:
+    """
+    Возвращает остатки времени, при которых Clock произнесёт сообщение.
+
+    Список упорядочен от ближайшего сообщения к самому позднему.
+    Момент окончания таймера (0) не озвучивается.
+    """
+    first = (seconds_left - 1) // voice_interval * voice_interval
+    return list(range(first, 0, -voice_interval))
+
+
+class PreSynthesizer:
+    """
+    Заранее синтезирует клипы предстоящих голосовых сообщений.
+
+    Тексты синтезируются пулом потоков в порядке расписания, то есть
+    ближайшие — первыми. Одновременно в работе не больше ahead клипов:
+    после каждого произнесённого сообщения advance() добавляет следующее.
+    Так кэш клипов не переполняется даже на суточном таймере.
+
+    Каждый поток пула владеет собственным движком pyttsx3.
+    """
+
+    def __init__(
+        self,
+        clip_cache: ClipCache,
+        workers: int,
+        ahead: int,
+        engine_factory: EngineFactory = create_engine,
+    ) -> None:
+        self.clip_cache = clip_cache
+        self.workers = workers
+        self.ahead = ahead
+        self.engine_factory = engine_factory
+        self.rendered = 0
+        self._pending: deque[str] = deque()
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None
+
+    def start(self, texts: list[str]) -> None:
+        """Начинает синтез расписания. Повторяющиеся тексты синтезируются один раз."""
+        self.stop()
+        self._pending = deque(dict.fromkeys(texts))
+        self._executor = self._new_executor()
+        self._submit(self.ahead)
+
+    def advance(self, count: int = 1) -> None:
+        """Сдвигает окно предварительного синтеза на count сообщений."""
+        self._submit(count)
+
+    def request(self, texts: list[str]) -> None:
+        """
+        Синтезирует тексты вне расписания, не дожидаясь окна.
+
+        Вызывается из потока речи, когда сообщению не хватило клипов.
+        Работает и после stop(): пул создаётся заново.
+        """
+        with self._lock:
+            if self._executor is None:
+                self._executor = self._new_executor()
+            for text in texts:
+                self._executor.submit(self._render, text)
+
+    def stop(self) -> None:
+        with self._lock:
+            if self._executor is None:
+                return
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+            self._pending.clear()
+
+    def _submit(self, count: int) -> None:
+        with self._lock:
+            executor = self._executor
+            if executor is None:
+                return
+            for _ in range(min(count, len(self._pending))):
+                executor.submit(self._render, self._pending.popleft())
+
+    def _new_executor(self) -> ThreadPoolExecutor:
+        return ThreadPoolExecutor(
+            max_workers=self.workers,
+            thread_name_prefix="presynth",
+        )
+
+    def _render(self, text: str) -> None:
+        try:
+            engine = self._engine()
+            key = engine_clip_key(engine, text)
+            if self.clip_cache.get(key) is not None:
+                return
+            if self.clip_cache.put(key, lambda path: render_clip(engine, text, path)):
+                self.rendered += 1
+        except Exception as err:
+            print(f"Ошибка предварительного синтеза: {type(err).__name__}: {err}")
+            self._local.engine = None
+
+    def _engine(self) -> Any:
+        engine = getattr(self._local, "engine", None)
+        if engine is None:
+            engine = self._local.engine = self.engine_factory()
+        return engine
@@ -5,6 +5,9 @@ class Signals(QObject):
     melody_finished = (
         pyqtSignal()
     )  # Сигнал о завершении проигрывания мелодии, завершающей таймер
+    melody_load_failed = pyqtSignal(
+        str
+    )  # Сигнал об ошибке подготовки мелодии; испускается из фонового потока
 
 
 signals = Signals()
@@ -0,0 +1,328 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable
+from contextlib import suppress
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from pyttsx3.engine import Engine  # type: ignore
+
+from .announcement_queue import Announcement, AnnouncementQueue, QueueStats
+from .clip_cache import ClipCache
+from .const import Const as C
+
+type EngineFactory = Callable[[], Any]
+type ClipPlayer = Callable[[Path], None]
+type FragmentsPlayer = Callable[[list[Path]], None]
+type ClipsRequest = Callable[[list[str]], None]
+
+
+def create_engine() -> Any:
+    """
+    Создаёт новый движок pyttsx3.
+
+    pyttsx3.init() возвращает закэшированный движок, поэтому после ошибки
+    он мог бы вернуть тот же сломанный экземпляр. Engine() создаёт новый.
+    """
+    return Engine()
+
+
+@dataclass(slots=True)
+class SpeechStats:
+    """Счётчики работы синтезатора речи. Время — в миллисекундах."""
+
+    engine_inits: int = 0
+    engine_init_ms: float = 0.0
+    messages: int = 0
+    failures: int = 0
+    queue_wait_ms: float = 0.0
+    speak_ms: float = 0.0
+    clip_hits: int = 0
+    clip_renders: int = 0
+    fragment_fallbacks: int = 0
+    render_ms: float = 0.0
+    latency_ms: float = 0.0
+    last_latency_ms: float = 0.0
+
+    @property
+    def avg_queue_wait_ms(self) -> float:
+        return self.queue_wait_ms / self.messages if self.messages else 0.0
+
+    @property
+    def avg_speak_ms(self) -> float:
+        return self.speak_ms / self.messages if self.messages else 0.0
+
+    def add_latency(self, latency_ms: float) -> None:
+        """
+        Учитывает задержку от извлечения сообщения из очереди до начала звука.
+
+        Ожидание в очереди сюда не входит: оно зависит от предыдущих
+        сообщений, а не от времени синтеза и запуска звука.
+
+        latency_ms — скользящая (экспоненциально сглаженная) оценка.
+        """
+        self.last_latency_ms = latency_ms
+        if self.latency_ms == 0.0:
+            self.latency_ms = latency_ms
+        else:
+            self.latency_ms += C.VOICE_LATENCY_SMOOTHING * (
+                latency_ms - self.latency_ms
+            )
+
+    def summary(self) -> str:
+        return (
+            f"инициализаций движка: {self.engine_inits} "
+            f"({self.engine_init_ms:.0f} мс), "
+            f"сообщений: {self.messages}, "
+            f"ошибок: {self.failures}, "
+            f"ожидание в очереди: {self.avg_queue_wait_ms:.0f} мс, "
+            f"произнесение: {self.avg_speak_ms:.0f} мс, "
+            f"клипы из кэша: {self.clip_hits}, "
+            f"синтезировано клипов: {self.clip_renders} "
+            f"({self.render_ms:.0f} мс), "
+            f"пропущено без готовых фрагментов: {self.fragment_fallbacks}, "
+            f"задержка начала звука: {self.latency_ms:.0f} мс"
+        )
+
+
+class SpeechWorker:
+    """
+    Долгоживущий поток синтеза речи.
+
+    Поток владеет единственным движком pyttsx3 и получает сообщения
+    через AnnouncementQueue: устаревшие сообщения не произносятся,
+    а новое сообщение заменяет ожидающие.
+    Движок создаётся один раз при старте потока и пересоздаётся
+    только после ошибки произнесения.
+
+    Если задан clip_cache, фраза синтезируется в файл один раз,
+    а затем проигрывается из кэша через play_clip.
+
+    Если задан play_fragments и сообщение передано фрагментами,
+    сообщение склеивается из готовых клипов отдельных фрагментов.
+    В этом режиме поток ничего не синтезирует: сообщение, для которого
+    не хватает клипов, пропускается, а недостающие фрагменты
+    передаются в request_clips для фонового синтеза.
+    """
+
+    def __init__(
+        self,
+        engine_factory: EngineFactory = create_engine,
+        clip_cache: ClipCache | None = None,
+        play_clip: ClipPlayer | None = None,
+        play_fragments: FragmentsPlayer | None = None,
+        request_clips: ClipsRequest | None = None,
+    ) -> None:
+        self.engine_factory = engine_factory
+        self.clip_cache = clip_cache
+        self.play_clip = play_clip
+        self.play_fragments = play_fragments
+        self.request_clips = request_clips
+        self.stats = SpeechStats()
+        self._engine: Any = None
+        self._dequeued_at: float | None = None
+        self._speaking_directly = False
+        self._queue = AnnouncementQueue(
+            maxsize=C.VOICE_QUEUE_SIZE,
+            late_ms=C.VOICE_LATE_MS,
+        )
+        self._thread = threading.Thread(
+            target=self._run,
+            name="speech-worker",
+            daemon=True,
+        )
+
+    @property
+    def queue_stats(self) -> QueueStats:
+        return self._queue.stats
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def say(
+        self,
+        text: str,
+        fragments: list[str] | None = None,
+        *,
+        max_delay_ms: float = C.VOICE_MAX_DELAY_MS,
+        urgent: bool = False,
+    ) -> None:
+        """
+        Ставит текст в очередь на произнесение.
+
+        fragments — тот же текст, разбитый на фрагменты для склейки.
+        Если склейка недоступна, произносится text целиком.
+
+        Если сообщение не удалось начать за max_delay_ms, оно отбрасывается.
+        urgent — сообщение финального периода, произносится в первую очередь.
+        """
+        now = time.perf_counter()
+        self._queue.put(
+            Announcement(
+                text=text,
+                fragments=tuple(fragments or ()),
+                queued_at=now,
+                deadline=now + max_delay_ms / 1000,
+                urgent=urgent,
+            )
+        )
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Останавливает поток после сообщений, которые уже в очереди."""
+        self._queue.close()
+        if self._thread.is_alive():
+            self._thread.join(timeout)
+
+    def _run(self) -> None:
+        self._ensure_engine()
+
+        while (message := self._queue.get()) is not None:
+            self.stats.queue_wait_ms += _ms_since(message.queued_at)
+            self._speak(message.text, message.fragments)
+
+        self._drop_engine()
+
+    def _speak(self, text: str, fragments: tuple[str, ...] = ()) -> None:
+        engine = self._ensure_engine()
+        if engine is None:
+            return
+
+        started = time.perf_counter()
+        self._dequeued_at = started
+        try:
+            if fragments and self.play_fragments is not None:
+                self._speak_fragments(engine, fragments, self.play_fragments)
+            else:
+                self._speak_phrase(engine, text)
+        except Exception as err:
+            print(f"Ошибка голосового сообщения: {type(err).__name__}: {err}")
+            self.stats.failures += 1
+            self._drop_engine()
+        finally:
+            self.stats.messages += 1
+            self.stats.speak_ms += _ms_since(started)
+
+    def _speak_fragments(
+        self, engine: Any, fragments: tuple[str, ...], play: FragmentsPlayer
+    ) -> None:
+        """
+        Склеивает сообщение из готовых клипов фрагментов.
+
+        Фрагменты здесь не синтезируются: их заранее синтезирует
+        PreSynthesizer. Если каких-то клипов нет в кэше, сообщение
+        пропускается, а недостающие фрагменты передаются в request_clips.
+        """
+        clips: list[Path] = []
+        missing: list[str] = []
+        for fragment in fragments:
+            clip = self._cached_clip(engine, fragment)
+            if clip is None:
+                missing.append(fragment)
+            else:
+                clips.append(clip)
+
+        if missing:
+            self.stats.fragment_fallbacks += 1
+            if self.request_clips is not None:
+                self.request_clips(missing)
+            return
+
+        self._audio_started()
+        play(clips)
+
+    def _speak_phrase(self, engine: Any, text: str) -> None:
+        clip = self._get_clip(engine, text)
+        if clip is not None and self.play_clip is not None:
+            self._audio_started()
+            self.play_clip(clip)
+            return
+
+        self._speaking_directly = True
+        try:
+            engine.say(text)
+            engine.runAndWait()
+        finally:
+            self._speaking_directly = False
+
+    def _on_started_utterance(self, **_: Any) -> None:
+        if self._speaking_directly:
+            self._audio_started()
+
+    def _audio_started(self) -> None:
+        """Фиксирует задержку от извлечения сообщения до начала звука."""
+        if self._dequeued_at is None:
+            return
+        self.stats.add_latency(_ms_since(self._dequeued_at))
+        self._dequeued_at = None
+
+    def _cached_clip(self, engine: Any, text: str) -> Path | None:
+        """Возвращает клип фразы из кэша или None, ничего не синтезируя."""
+        if self.clip_cache is None:
+            return None
+
+        clip = self.clip_cache.get(engine_clip_key(engine, text))
+        if clip is not None:
+            self.stats.clip_hits += 1
+        return clip
+
+    def _get_clip(self, engine: Any, text: str) -> Path | None:
+        """Возвращает клип фразы из кэша, при отсутствии — синтезирует его."""
+        if self.clip_cache is None:
+            return None
+
+        if (clip := self._cached_clip(engine, text)) is not None:
+            return clip
+
+        key = engine_clip_key(engine, text)
+        started = time.perf_counter()
+        clip = self.clip_cache.put(key, lambda path: render_clip(engine, text, path))
+        self.stats.clip_renders += 1
+        self.stats.render_ms += _ms_since(started)
+        return clip
+
+    def _ensure_engine(self) -> Any:
+        if self._engine is not None:
+            return self._engine
+
+        started = time.perf_counter()
+        try:
+            self._engine = self.engine_factory()
+            self._engine.connect("started-utterance", self._on_started_utterance)
+        except Exception as err:
+            print(f"{C.TEXT_NO_INIT_SPEECH}: {type(err).__name__}: {err}")
+            self.stats.failures += 1
+            return None
+        finally:
+            self.stats.engine_inits += 1
+            self.stats.engine_init_ms += _ms_since(started)
+
+        return self._engine
+
+    def _drop_engine(self) -> None:
+        if self._engine is None:
+            return
+        with suppress(Exception):
+            self._engine.stop()
+        self._engine = None
+
+
+def engine_clip_key(engine: Any, text: str) -> str:
+    """Ключ клипа с учётом текущего голоса, скорости и драйвера движка."""
+    return ClipCache.clip_key(
+        text,
+        voice=str(engine.getProperty("voice")),
+        rate=int(engine.getProperty("rate")),
+        engine=str(getattr(engine, "driver_name", type(engine).__name__)),
+    )
+
+
+def render_clip(engine: Any, text: str, path: Path) -> None:
+    engine.save_to_file(text, str(path))
+    engine.runAndWait()
+
+
+def _ms_since(started: float) -> float:
+    return (time.perf_counter() - started) * 1000
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_right
+
+HISTOGRAM_EDGES_MS = (1, 2, 5, 10, 20, 50, 100, 1000)
+
+
+class TickStats:
+    """
+    Опоздания тактов таймера за последние capacity тактов.
+
+    Значения пишутся в кольцевой буфер array('d') фиксированного размера:
+    запись такта ничего не выделяет. Статистика считается по запросу.
+    Опоздание отрицательно, если такт сработал раньше срока.
+    Переполнение — такт опоздал на интервал таймера или больше,
+    то есть как минимум один такт пропущен.
+    """
+
+    def __init__(self, capacity: int, interval_ms: int) -> None:
+        self.capacity = capacity
+        self.interval = interval_ms
+        self.count = 0
+        self.overruns = 0
+        self._values = array("d", bytes(8 * capacity))
+        self._next = 0
+
+    def __len__(self) -> int:
+        return min(self.count, self.capacity)
+
+    def record(self, late_ms: float) -> None:
+        self._values[self._next] = late_ms
+        self._next = (self._next + 1) % self.capacity
+        self.count += 1
+        if late_ms >= self.interval:
+            self.overruns += 1
+
+    def values(self) -> list[float]:
+        """Значения в буфере, от старых к новым."""
+        if self.count < self.capacity:
+            return self._values[: self.count].tolist()
+        return (self._values[self._next :] + self._values[: self._next]).tolist()
+
+    def min(self) -> float:
+        return min(self.values(), default=0.0)
+
+    def max(self) -> float:
+        return max(self.values(), default=0.0)
+
+    def mean(self) -> float:
+        values = self.values()
+        return sum(values) / len(values) if values else 0.0
+
+    def percentile(self, percent: float) -> float:
+        """Перцентиль методом ближайшего ранга."""
+        values = sorted(self.values())
+        if not values:
+            return 0.0
+        rank = max(1, -(-len(values) * percent // 100))
+        return values[int(rank) - 1]
+
+    def histogram(self, edges_ms: tuple[int, ...] = HISTOGRAM_EDGES_MS) -> list[int]:
+        """
+        Число тактов по корзинам опоздания.
+
+        Корзина i содержит такты с опозданием меньше edges_ms[i]
+        (и не меньше предыдущей границы); последняя — все остальные.
+        """
+        buckets = [0] * (len(edges_ms) + 1)
+        for value in self.values():
+            buckets[bisect_right(edges_ms, value)] += 1
+        return buckets
+
+    def summary(self) -> str:
+        return (
+            f"тактов: {self.count}, опоздание, мс: "
+            f"мин {self.min():.1f}, среднее {self.mean():.1f}, "
+            f"p50 {self.percentile(50):.1f}, p99 {self.percentile(99):.1f}, "
+            f"макс {self.max():.1f}, переполнений: {self.overruns}"
+        )
@@ -0,0 +1,221 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Protocol
+
+from .timer_heap import HeapEntry, TimerHeap
+
+if TYPE_CHECKING:
+    from PyQt6.QtCore import QTimer
+
+
+class TimerHandle(Protocol):
+    """
+    Запланированный вызов, который можно отменить.
+
+    restart() планирует тот же вызов заново через delay_ms, отменяя
+    ожидающий; так частый вызов не создаёт новый таймер каждый раз.
+    """
+
+    def cancel(self) -> None: ...
+
+    def is_active(self) -> bool: ...
+
+    def restart(self, delay_ms: float) -> None: ...
+
+
+class TimeSource(Protocol):
+    """
+    Источник времени для часов.
+
+    now() — монотонное время в секундах.
+    call_later() — однократный вызов callback через delay_ms миллисекунд.
+    """
+
+    def now(self) -> float: ...
+
+    def call_later(
+        self, delay_ms: float, callback: Callable[[], None]
+    ) -> TimerHandle: ...
+
+
+class QtTimerHandle:
+    def __init__(self, source: QtTimeSource, timer: QTimer) -> None:
+        self.source = source
+        self.timer = timer
+
+    def cancel(self) -> None:
+        self.timer.stop()
+        self.source.pending.discard(self)
+
+    def is_active(self) -> bool:
+        return self.timer.isActive()
+
+    def restart(self, delay_ms: float) -> None:
+        self.source.pending.add(self)
+        self.timer.start(max(0, round(delay_ms)))
+
+
+class QtTimeSource:
+    """
+    Реальное время: time.monotonic и однократные точные QTimer.
+
+    Источник хранит ссылки на ожидающие таймеры, поэтому вызывающему
+    не нужно хранить дескриптор, если отмена не требуется.
+    Qt импортируется при первом вызове: модуль можно загрузить без Qt.
+    """
+
+    def __init__(self) -> None:
+        self.pending: set[QtTimerHandle] = set()
+
+    def now(self) -> float:
+        return time.monotonic()
+
+    def call_later(
+        self, delay_ms: float, callback: Callable[[], None]
+    ) -> QtTimerHandle:
+        from PyQt6.QtCore import Qt, QTimer
+
+        timer = QTimer()
+        timer.setSingleShot(True)
+        timer.setTimerType(Qt.TimerType.PreciseTimer)
+        handle = QtTimerHandle(self, timer)
+
+        def fire() -> None:
+            self.pending.discard(handle)
+            callback()
+
+        timer.timeout.connect(fire)
+        self.pending.add(handle)
+        timer.start(max(0, round(delay_ms)))
+        return handle
+
+
+class AsyncioTimerHandle:
+    def __init__(
+        self, loop: asyncio.AbstractEventLoop, callback: Callable[[], None]
+    ) -> None:
+        self.loop = loop
+        self.callback = callback
+        self.handle: asyncio.TimerHandle | None = None
+        self.active = True
+
+    def cancel(self) -> None:
+        if self.handle is not None:
+            self.handle.cancel()
+        self.active = False
+
+    def is_active(self) -> bool:
+        return self.active
+
+    def restart(self, delay_ms: float) -> None:
+        self.cancel()
+        self.handle = self.loop.call_later(max(0.0, delay_ms) / 1000, self.fire)
+        self.active = True
+
+    def fire(self) -> None:
+        self.active = False
+        self.callback()
+
+
+class AsyncioTimeSource:
+    """
+    Реальное время цикла asyncio: loop.time() и loop.call_later().
+
+    Не требует Qt: часы на этом источнике работают в процессе без GUI.
+    Цикл по умолчанию — текущий работающий цикл событий.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop | None = None) -> None:
+        self.loop = asyncio.get_running_loop() if loop is None else loop
+
+    def now(self) -> float:
+        return self.loop.time()
+
+    def call_later(
+        self, delay_ms: float, callback: Callable[[], None]
+    ) -> AsyncioTimerHandle:
+        handle = AsyncioTimerHandle(self.loop, callback)
+        handle.restart(delay_ms)
+        return handle
+
+
+class VirtualTimerHandle:
+    def __init__(self, source: VirtualTimeSource, callback: Callable[[], None]) -> None:
+        self.heap = source._heap
+        self.source = source
+        self.callback = callback
+        self.entry: HeapEntry | None = None
+        self.active = True
+
+    def cancel(self) -> None:
+        if self.active and self.entry is not None:
+            self.heap.cancel(self.entry)
+        self.active = False
+
+    def is_active(self) -> bool:
+        return self.active
+
+    def restart(self, delay_ms: float) -> None:
+        self.cancel()
+        self.entry = self.heap.push(self.source.now() + max(0.0, delay_ms) / 1000, self)
+        self.active = True
+
+
+class VirtualTimeSource:
+    """
+    Моделируемое время для тестов и прогонов с ускорением.
+
+    Время стоит на месте, пока его не продвинут advance() или run();
+    при продвижении запланированные вызовы выполняются в порядке
+    их времени, и now() в каждом вызове равно его сроку.
+    Сутки отсчёта прогоняются за доли секунды.
+    """
+
+    def __init__(self, start: float = 0.0) -> None:
+        self._now = start
+        self._heap = TimerHeap()
+
+    def now(self) -> float:
+        return self._now
+
+    def call_later(
+        self, delay_ms: float, callback: Callable[[], None]
+    ) -> VirtualTimerHandle:
+        handle = VirtualTimerHandle(self, callback)
+        handle.restart(delay_ms)
+        return handle
+
+    def advance(self, seconds: float) -> None:
+        """Продвигает время на seconds, выполняя наступившие вызовы."""
+        self.run_until(self._now + seconds)
+
+    def run_until(self, moment: float) -> None:
+        while (due := self._heap.next_due()) is not None and due <= moment:
+            self._fire_due(due)
+        self._now = max(self._now, moment)
+
+    def run(self, limit: float = float("inf")) -> None:
+        """Выполняет вызовы, пока они есть, но не дальше момента limit."""
+        while (due := self._heap.next_due()) is not None and due <= limit:
+            self._fire_due(due)
+
+    def block(self, seconds: float) -> None:
+        """
+        Продвигает время, не выполняя вызовы, — как занятый цикл событий.
+
+        Просроченные вызовы выполнятся при следующем advance() или run().
+        """
+        self._now += seconds
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def _fire_due(self, due: float) -> None:
+        self._now = max(self._now, due)
+        for _, _, handle in self._heap.pop_due(due):
+            if handle.active:
+                handle.active = False
+                handle.callback()
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+from functools import cache
+
+from .const import Const as C
+
+TABLE_SIZE = C.SECONDS_IN_MINUTE
+
+
+def hour_minutes_sec(seconds: int) -> tuple[int, int, int]:
+    hour, min_sec = divmod(seconds, C.SECONDS_IN_HOUR)
+    minutes, sec = divmod(min_sec, C.SECONDS_IN_MINUTE)
+    return hour, minutes, sec
+
+
+def time_to_text(seconds: int) -> str:
+    hour, minutes, sec = hour_minutes_sec(seconds)
+    hour_text = num_to_text(hour, C.GENDER_M, C.FORMS_HOUR)
+    minutes_text = num_to_text(minutes, C.GENDER_F, C.FORMS_MINUTE)
+    sec_text = num_to_text(sec, C.GENDER_F, C.FORMS_SECUNDA)
+    return (hour_text + minutes_text + sec_text).capitalize()
+
+
+def num_to_text(number: int, gender: str, word_forms: list[str]) -> str:
+    """
+    Возвращает «число единица » прописью.
+
+    Тексты берутся из таблицы, которая строится один раз при первом
+    обращении. Таймер работает в пределах суток, поэтому таблицы
+    покрывают числа 0..59; большие числа пишутся через num2words.
+    """
+    if number == 0:
+        return ""
+    if number < TABLE_SIZE:
+        return _texts(gender, tuple(word_forms))[number]
+    return f"{spell_number(number, gender)} {get_word_form(number, word_forms)} "
+
+
+def time_to_fragments(seconds: int) -> list[str]:
+    """
+    Разбивает сообщение об остатке времени на фрагменты для склейки.
+
+    Фрагмент — это число прописью или название единицы времени
+    в нужной форме: ["один", "час", "две", "минуты"].
+    """
+    fragments: list[str] = []
+    for number, gender, word_forms in _time_parts(seconds):
+        if number:
+            fragments.append(number_words(number, gender))
+            fragments.append(get_word_form(number, word_forms))
+    return fragments
+
+
+def all_time_fragments() -> list[str]:
+    """
+    Возвращает все фрагменты, из которых склеиваются сообщения в пределах суток:
+    числа 1..59 в мужском и женском роде и все формы единиц времени.
+    """
+    fragments = dict.fromkeys(
+        words
+        for gender in (C.GENDER_M, C.GENDER_F)
+        for words in _number_words(gender)[1:]
+    )
+    fragments.update(dict.fromkeys(C.FORMS_HOUR + C.FORMS_MINUTE + C.FORMS_SECUNDA))
+    return list(fragments)
+
+
+def number_words(number: int, gender: str) -> str:
+    if number < TABLE_SIZE:
+        return _number_words(gender)[number]
+    return spell_number(number, gender)
+
+
+def get_word_form(number: int, word_after_number: list[str]) -> str:
+    last_digit = number % 10
+    last_digits = number % 100
+
+    match last_digit:
+        case 1 if not 11 <= last_digits <= 14:
+            return word_after_number[1]
+        case 2 | 3 | 4 if not 11 <= last_digits <= 14:
+            return word_after_number[2]
+        case _:
+            return word_after_number[0]
+
+
+def spell_number(number: int, gender: str) -> str:
+    """Число прописью через num2words. Используется только для заполнения таблиц."""
+    from num2words import num2words  # type: ignore
+
+    return str(num2words(number, lang=C.LANG_RU, gender=gender))
+
+
+def time_to_text_num2words(seconds: int) -> str:
+    """
+    Строит текст сообщения без таблиц, вызывая num2words на каждое число.
+
+    Эталон для проверки таблиц и для сравнения скорости.
+    """
+    text = ""
+    for number, gender, word_forms in _time_parts(seconds):
+        if number:
+            text += f"{spell_number(number, gender)} "
+            text += f"{get_word_form(number, word_forms)} "
+    return text.capitalize()
+
+
+@cache
+def _number_words(gender: str) -> tuple[str, ...]:
+    return ("",) + tuple(
+        spell_number(number, gender) for number in range(1, TABLE_SIZE)
+    )
+
+
+@cache
+def _texts(gender: str, word_forms: tuple[str, ...]) -> tuple[str, ...]:
+    words = _number_words(gender)
+    return ("",) + tuple(
+        f"{words[number]} {get_word_form(number, list(word_forms))} "
+        for number in range(1, TABLE_SIZE)
+    )
+
+
+def _time_parts(seconds: int) -> list[tuple[int, str, list[str]]]:
+    hour, minutes, sec = hour_minutes_sec(seconds)
+    return [
+        (hour, C.GENDER_M, C.FORMS_HOUR),
+        (minutes, C.GENDER_F, C.FORMS_MINUTE),
+        (sec, C.GENDER_F, C.FORMS_SECUNDA),
+    ]
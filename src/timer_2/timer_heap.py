@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import heapq
+import itertools
+from typing import Any
+
+type HeapEntry = list[Any]
+
+_CANCELLED = object()
+
+
+class TimerHeap:
+    """
+    Очередь событий с приоритетом по времени срабатывания.
+
+    Запись — список [due_ms, seq, item]: списки сравниваются
+    на уровне C, без вызова Python-методов сравнения.
+    seq сохраняет порядок добавления событий с одинаковым временем.
+
+    push и pop — O(log n). Отмена ленивая: запись помечается и
+    пропускается при извлечении, поэтому cancel — O(1). Когда отменённых
+    записей становится больше половины, куча перестраивается.
+    """
+
+    def __init__(self) -> None:
+        self._heap: list[HeapEntry] = []
+        self._seq = itertools.count()
+        self._cancelled = 0
+
+    def __len__(self) -> int:
+        return len(self._heap) - self._cancelled
+
+    def push(self, due_ms: float, item: Any) -> HeapEntry:
+        entry = [due_ms, next(self._seq), item]
+        heapq.heappush(self._heap, entry)
+        return entry
+
+    def cancel(self, entry: HeapEntry) -> None:
+        if entry[2] is _CANCELLED:
+            return
+        entry[2] = _CANCELLED
+        self._cancelled += 1
+        if self._cancelled > len(self._heap) // 2:
+            self._compact()
+
+    def next_due(self) -> float | None:
+        """Время ближайшего события или None, если событий нет."""
+        self._skip_cancelled()
+        return self._heap[0][0] if self._heap else None
+
+    def pop_due(self, now_ms: float) -> list[HeapEntry]:
+        """Извлекает все события со временем срабатывания не позже now_ms."""
+        heap = self._heap
+        due: list[HeapEntry] = []
+        while heap and heap[0][0] <= now_ms:
+            entry = heapq.heappop(heap)
+            if entry[2] is _CANCELLED:
+                self._cancelled -= 1
+            else:
+                due.append(entry)
+        return due
+
+    def _skip_cancelled(self) -> None:
+        while self._heap and self._heap[0][2] is _CANCELLED:
+            heapq.heappop(self._heap)
+            self._cancelled -= 1
+
+    def _compact(self) -> None:
+        self._heap = [entry for entry in self._heap if entry[2] is not _CANCELLED]
+        heapq.heapify(self._heap)
+        self._cancelled = 0
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
+from collections.abc import Mapping
 from pathlib import Path
 
 from PyQt6 import uic
-from PyQt6.QtCore import QSignalBlocker, Qt
+from PyQt6.QtCore import QCoreApplication, QSignalBlocker, Qt
 from PyQt6.QtGui import QIntValidator
 from PyQt6.QtWidgets import (
     QCheckBox,
@@ -24,12 +25,21 @@ from . import functions as f
 
 
 class TunesSettings:
-    """Менеджер настроек: модель + загрузка/сохранение + переключение файла."""
+    """
+    Менеджер настроек: модель + загрузка/сохранение + переключение файла.
+
+    Изменения сохраняются отложенно (TunesStorage.save_later);
+    при выходе из программы отложенное сохранение выполняется сразу.
+    """
 
     def __init__(self) -> None:
         self.storage = TunesStorage()
         self.model: TunesModel = dto_to_model(self.storage.load())
 
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.flush)
+
     @property
     def settings_file(self) -> Path:
         return self.storage.settings_file
@@ -37,6 +47,12 @@ class TunesSettings:
     def save(self) -> None:
         self.storage.save(model_to_dto(self.model))
 
+    def save_later(self) -> None:
+        self.storage.save_later(model_to_dto(self.model))
+
+    def flush(self) -> None:
+        self.storage.flush()
+
     def switch_settings_file(self, settings_file: Path) -> None:
         """
         Переключает активный файл настроек.
@@ -46,7 +62,12 @@ class TunesSettings:
 
     def set_value(self, key: TuneKey, value: TuneValue | str) -> None:
         self.model.set_value(key, value)
-        self.save()
+        self.save_later()
+
+    def set_many(self, values: Mapping[TuneKey, TuneValue | str]) -> None:
+        """Применяет все значения или ни одного и сохраняет их одной записью."""
+        self.model.set_values(values)
+        self.save_later()
 
 
 class TunesWindow(QWidget):
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections.abc import Mapping
+from dataclasses import dataclass, replace
 
 from .tune_key import TuneKey
 
@@ -74,6 +75,20 @@ class TunesModel:
             case _:
                 raise KeyError(f"Неизвестный ключ настройки: {key!r}")
 
+    def set_values(self, values: Mapping[TuneKey, TuneValue | str]) -> None:
+        """
+        Устанавливает несколько настроек как одно изменение.
+
+        Сначала все значения проверяются на копии модели; если хотя бы
+        одно неверно, исключение выбрасывается и модель не меняется.
+        """
+        staged = replace(self)
+        for key, value in values.items():
+            staged.set_value(key, value)
+
+        for key in values:
+            self.set_value(key, staged.get_value(key))
+
 
 def _to_int(value: TuneValue | str, *, min_value: int, max_value: int) -> int:
     """
@@ -1,10 +1,18 @@
 from __future__ import annotations
 
+import hashlib
 import json
 import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass, replace
 from pathlib import Path
 from typing import Any
 
+from .const import Const as C
+from .tick_stats import TickStats
 from .tunes_dto import TunesDTO
 from .tunes_mapper import default_dto, dto_to_json_dict, json_dict_to_dto
 
@@ -13,6 +21,99 @@ PROGRAM_NAME = "Timer_2"
 ACTIVE_SETTINGS_FILE_NAME = "active_settings.json"
 ACTIVE_SETTINGS_KEY = "active_settings_file"
 USER_PROFILE_FILE_NAME = "user.json"
+BACKUP_SUFFIX = ".bak"
+TEMP_SUFFIX = ".tmp"
+
+
+@dataclass(slots=True)
+class SaveStats:
+    """Счётчики отложенного сохранения настроек."""
+
+    requests: int = 0
+    writes: int = 0
+    avoided: int = 0  # записи, заменённые более новыми данными до записи
+    failures: int = 0
+
+
+class WriteBehind:
+    """
+    Отложенная запись настроек в фоновом потоке.
+
+    submit() только запоминает последние данные; поток записывает их,
+    когда после последнего изменения прошло delay_s секунд. Изменения
+    внутри этого окна сливаются в одну запись. flush() записывает
+    отложенные данные сразу, в вызывающем потоке.
+    """
+
+    def __init__(
+        self,
+        write: Callable[[Path, TunesDTO], bool],
+        delay_s: float,
+        on_failure: Callable[[Path], None],
+    ) -> None:
+        self.write = write
+        self.delay_s = delay_s
+        self.on_failure = on_failure
+        self.stats = SaveStats()
+        self._cond = threading.Condition()
+        self._pending: tuple[Path, TunesDTO] | None = None
+        self._due = 0.0
+        self._writing = False
+        self._thread: threading.Thread | None = None
+
+    def submit(self, path: Path, dto: TunesDTO) -> None:
+        with self._cond:
+            self.stats.requests += 1
+            if self._pending is not None:
+                self.stats.avoided += 1
+            self._pending = (path, dto)
+            self._due = time.monotonic() + self.delay_s
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="tunes-writer", daemon=True
+                )
+                self._thread.start()
+            self._cond.notify_all()
+
+    def flush(self) -> None:
+        with self._cond:
+            while self._writing:
+                self._cond.wait()
+            pending = self._take()
+        if pending is not None:
+            self._write(pending)
+
+    def _take(self) -> tuple[Path, TunesDTO] | None:
+        """Забирает отложенные данные; вызывается под self._cond."""
+        pending, self._pending = self._pending, None
+        if pending is not None:
+            self._writing = True
+        return pending
+
+    def _write(self, pending: tuple[Path, TunesDTO]) -> None:
+        try:
+            if self.write(*pending):
+                self.stats.writes += 1
+            else:
+                self.stats.failures += 1
+                self.on_failure(pending[0])
+        finally:
+            with self._cond:
+                self._writing = False
+                self._cond.notify_all()
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while self._pending is None:
+                    self._cond.wait()
+                delay = self._due - time.monotonic()
+                if delay > 0:
+                    self._cond.wait(delay)
+                    continue
+                pending = self._take()
+            if pending is not None:
+                self._write(pending)
 
 
 class TunesStorage:
@@ -23,11 +124,47 @@ class TunesStorage:
     - default_dto() — заводские значения в коде;
     - profiles/user.json — основной рабочий файл пользователя;
     - active_settings.json — служебный указатель на активный файл настроек.
+
+    save() пишет файл сразу; save_later() — через WriteBehind, с задержкой
+    C.TUNES_SAVE_DELAY_MS. Об ошибке отложенной записи предупреждение
+    появляется в self.warnings позже, после самой записи.
+
+    Для каждого прочитанного или записанного файла запоминается хэш
+    содержимого, и запись того же содержимого в неизменённый файл
+    пропускается: при обычном запуске файлы только читаются.
+
+    Файл заменяется атомарно: данные пишутся во временный файл, который
+    затем переименовывается поверх основного. Предыдущая заведомо
+    исправная версия сохраняется как <файл>.bak, и при повреждённом
+    или отсутствующем основном файле настройки читаются из неё.
+    fsync выполняется не чаще раза в C.TUNES_FSYNC_INTERVAL_MS;
+    несинхронизированные файлы досинхронизирует flush().
+    Длительность каждой записи в мс пишется в save_ms.
+
+    Прочитанные и записанные профили хранятся в LRU-кэше из
+    C.TUNES_PROFILE_CACHE_SIZE DTO с ключом «путь + (mtime_ns, size)»:
+    переключение на неизменённый профиль стоит одного stat().
     """
 
     def __init__(self) -> None:
         self.warnings: list[str] = []
+        self.writes = 0
+        self.skipped_writes = 0
+        self._known: dict[Path, tuple[bytes, int, int]] = {}
+        self._unsynced: set[Path] = set()
+        self._last_fsync = float("-inf")
+        self.fsyncs = 0
+        self.save_ms = TickStats(C.TUNES_SAVE_STATS_SIZE, C.TUNES_SLOW_SAVE_MS)
+        self.profile_hits = 0
+        self.profile_misses = 0
+        self._profiles: OrderedDict[Path, tuple[int, int, TunesDTO]] = OrderedDict()
+        self._profiles_lock = threading.Lock()
         self.settings_file = self._load_active_settings_file()
+        self.writer = WriteBehind(
+            self._write_dto_to_file,
+            C.TUNES_SAVE_DELAY_MS / 1000,
+            self._warn_save_failed,
+        )
 
     # ------------------------------------------------------------------
     # Публичные методы
@@ -52,12 +189,23 @@ class TunesStorage:
         Сохраняет настройки в текущий активный файл.
         """
         if not self._write_dto_to_file(self.settings_file, dto):
-            self.warnings.append(
-                "Не удалось сохранить файл настроек.\n"
-                f"Файл: {self.settings_file}\n"
-                "Изменения будут действовать до завершения программы, "
-                "но могут быть потеряны после перезапуска."
-            )
+            self._warn_save_failed(self.settings_file)
+
+    def save_later(self, dto: TunesDTO) -> None:
+        """
+        Откладывает сохранение в текущий активный файл.
+
+        Если C.TUNES_SAVE_DELAY_MS равна 0, сохраняет сразу.
+        """
+        if C.TUNES_SAVE_DELAY_MS <= 0:
+            self.save(dto)
+            return
+        self.writer.submit(self.settings_file, dto)
+
+    def flush(self) -> None:
+        """Записывает отложенные настройки сразу и синхронизирует их с диском."""
+        self.writer.flush()
+        self._sync_unsynced()
 
     def switch_settings_file(self, settings_file: Path) -> TunesDTO:
         """
@@ -66,14 +214,19 @@ class TunesStorage:
         Если выбранный файл отсутствует, недоступен или повреждён,
         используются настройки по умолчанию, а предупреждение
         передаётся UI-слою через self.warnings.
+
+        Неизменённый профиль из кэша не читается и не перезаписывается.
         """
         new_file = settings_file.expanduser().resolve()
 
-        dto = self._load_from_file(new_file)
+        self.flush()
+        cached = self._cached_profile(new_file)
+        dto = cached if cached is not None else self._load_from_file(new_file)
 
         self.settings_file = new_file
         self._save_active_settings_file(new_file)
-        self.save(dto)
+        if cached is None:
+            self.save(dto)
 
         return dto
 
@@ -81,8 +234,7 @@ class TunesStorage:
         """
         Возвращает накопленные предупреждения и очищает список.
         """
-        warnings = self.warnings.copy()
-        self.warnings.clear()
+        warnings, self.warnings = self.warnings, []
         return warnings
 
     # ------------------------------------------------------------------
@@ -91,10 +243,17 @@ class TunesStorage:
 
     @classmethod
     def _app_dir(cls) -> Path:
+        """
+        Каталог программы, с разрешёнными ссылками.
+
+        Все пути хранилища абсолютные и разрешённые: по ним ведутся
+        хэши файлов и кэш профилей, и один файл не должен попасть
+        туда под двумя именами.
+        """
         base_dir = Path(os.getenv("APPDATA", Path.home()))
         app_dir = base_dir / PROGRAM_NAME
         app_dir.mkdir(parents=True, exist_ok=True)
-        return app_dir
+        return app_dir.resolve()
 
     @classmethod
     def _profiles_dir(cls) -> Path:
@@ -137,7 +296,8 @@ class TunesStorage:
             return self._user_settings_file()
 
         try:
-            text = registry_file.read_text(encoding="utf-8")
+            raw = registry_file.read_bytes()
+            text = raw.decode("utf-8")
         except (OSError, UnicodeDecodeError):
             return self._user_settings_file()
 
@@ -148,6 +308,7 @@ class TunesStorage:
 
         if not isinstance(data, dict):
             return self._user_settings_file()
+        self._remember(registry_file, raw)
 
         value = data.get(ACTIVE_SETTINGS_KEY)
 
@@ -170,7 +331,49 @@ class TunesStorage:
         Не меняет self.settings_file.
         Не меняет active_settings.json.
         """
-        return self._write_json_file(dto_to_json_dict(dto), path)
+        if not self._write_json_file(dto_to_json_dict(dto), path):
+            return False
+        self._cache_profile(path, dto)
+        return True
+
+    # ------------------------------------------------------------------
+    # Кэш профилей
+    # ------------------------------------------------------------------
+
+    def _cached_profile(self, path: Path) -> TunesDTO | None:
+        """Возвращает копию DTO из кэша, если файл не менялся, иначе None."""
+        with self._profiles_lock:
+            entry = self._profiles.get(path)
+            if entry is None:
+                self.profile_misses += 1
+                return None
+            try:
+                stat = path.stat()
+            except OSError:
+                stat = None
+            if stat is None or entry[:2] != (stat.st_mtime_ns, stat.st_size):
+                del self._profiles[path]
+                self.profile_misses += 1
+                return None
+            self._profiles.move_to_end(path)
+            self.profile_hits += 1
+            return replace(entry[2])
+
+    def _cache_profile(self, path: Path, dto: TunesDTO) -> None:
+        """
+        Кэширует DTO, только что прочитанный из path или записанный в него.
+
+        Подпись файла берётся из self._known, заполненного при этом
+        чтении или записи, поэтому лишний stat() не нужен.
+        """
+        known = self._known.get(path)
+        if known is None:
+            return
+        with self._profiles_lock:
+            self._profiles[path] = (known[1], known[2], replace(dto))
+            self._profiles.move_to_end(path)
+            while len(self._profiles) > C.TUNES_PROFILE_CACHE_SIZE:
+                self._profiles.popitem(last=False)
 
     def _save_active_settings_file(self, settings_file: Path) -> None:
         """
@@ -197,22 +400,131 @@ class TunesStorage:
         Метод:
         - создаёт родительский каталог файла, если он отсутствует;
         - сериализует data в JSON;
-        - записывает JSON в файл path в кодировке UTF-8.
+        - записывает JSON в файл path в кодировке UTF-8, если файл
+          уже не содержит ровно эти байты (см. _is_unchanged());
+        - заменяет файл атомарно (см. _replace_file()).
 
         Возвращает:
-            True  — файл успешно записан;
+            True  — файл успешно записан или уже актуален;
             False — файл не удалось записать.
         """
+        started = time.perf_counter()
         try:
+            raw = json.dumps(data, ensure_ascii=False, indent=4).encode("utf-8")
+            if self._is_unchanged(path, raw):
+                self.skipped_writes += 1
+                return True
             path.parent.mkdir(parents=True, exist_ok=True)
-            path.write_text(
-                json.dumps(data, ensure_ascii=False, indent=4),
-                encoding="utf-8",
-            )
-            return True
+            self._replace_file(path, raw)
         except (OSError, UnicodeError, TypeError):
             return False
 
+        self.save_ms.record((time.perf_counter() - started) * 1000)
+        self.writes += 1
+        self._remember(path, raw)
+        return True
+
+    def _replace_file(self, path: Path, raw: bytes) -> None:
+        """
+        Атомарно заменяет содержимое path на raw.
+
+        Если текущий файл заведомо исправен (прочитан или записан нами
+        и с тех пор не менялся) и уже синхронизирован с диском, он
+        становится резервной копией. Иначе прежняя резервная копия
+        сохраняется: при сбое питания она остаётся последней версией,
+        которая точно есть на диске.
+        """
+        temp = path.with_name(path.name + TEMP_SUFFIX)
+        with temp.open("wb") as file:
+            file.write(raw)
+            file.flush()
+            sync = self._fsync_due()
+            if sync:
+                os.fsync(file.fileno())
+                self.fsyncs += 1
+
+        if path not in self._unsynced and self._is_known_good(path):
+            os.replace(path, _backup_path(path))
+        os.replace(temp, path)
+
+        if sync:
+            self._unsynced.discard(path)
+            self._sync_dir(path.parent)
+        else:
+            self._unsynced.add(path)
+
+    def _fsync_due(self) -> bool:
+        """Разрешает fsync, если с предыдущего прошло C.TUNES_FSYNC_INTERVAL_MS."""
+        now = time.monotonic()
+        if (now - self._last_fsync) * 1000 < C.TUNES_FSYNC_INTERVAL_MS:
+            return False
+        self._last_fsync = now
+        return True
+
+    def _sync_unsynced(self) -> None:
+        """Синхронизирует с диском файлы, записанные без fsync."""
+        for path in list(self._unsynced):
+            self._unsynced.discard(path)
+            try:
+                with path.open("r+b") as file:
+                    os.fsync(file.fileno())
+            except OSError:
+                continue
+            self.fsyncs += 1
+            self._last_fsync = time.monotonic()
+            self._sync_dir(path.parent)
+
+    def _sync_dir(self, directory: Path) -> None:
+        """
+        Синхронизирует каталог, чтобы переименование пережило сбой питания.
+
+        В Windows каталог нельзя открыть для fsync; там это не требуется.
+        """
+        if os.name != "posix":
+            return
+        try:
+            fd = os.open(directory, os.O_RDONLY)
+        except OSError:
+            return
+        try:
+            os.fsync(fd)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+    def _remember(self, path: Path, raw: bytes) -> None:
+        """Запоминает хэш содержимого файла вместе с его mtime и размером."""
+        try:
+            stat = path.stat()
+        except OSError:
+            self._known.pop(path, None)
+            return
+        self._known[path] = (_digest(raw), stat.st_mtime_ns, stat.st_size)
+
+    def _is_unchanged(self, path: Path, raw: bytes) -> bool:
+        """
+        Проверяет, что файл уже содержит raw.
+
+        Файл, изменённый другой программой после нашего чтения или записи,
+        отличается mtime или размером и считается изменённым.
+        """
+        known = self._known.get(path)
+        if known is None or not self._is_known_good(path):
+            return False
+        return known[0] == _digest(raw)
+
+    def _is_known_good(self, path: Path) -> bool:
+        """Файл прочитан или записан нами и с тех пор не менялся."""
+        known = self._known.get(path)
+        if known is None:
+            return False
+        try:
+            stat = path.stat()
+        except OSError:
+            return False
+        return known[1:] == (stat.st_mtime_ns, stat.st_size)
+
     # ------------------------------------------------------------------
     # Чтение файлов
     # ------------------------------------------------------------------
@@ -223,66 +535,108 @@ class TunesStorage:
 
         Если файл отсутствует, недоступен, повреждён
         или имеет неверную структуру:
-        - добавляет предупреждение в self.warnings;
-        - возвращает DTO по умолчанию.
+        - возвращает DTO из резервной копии, если она исправна,
+          иначе DTO по умолчанию;
+        - добавляет в self.warnings одно предупреждение: о проблеме
+          и о том, какие настройки будут использованы.
         """
         path = settings_file.expanduser().resolve()
 
-        if not self._is_readable_settings_file(path):
-            return default_dto()
+        problems: list[str] = []
+        raw_data = self._read_settings_dict(path, problems)
+        if raw_data is not None:
+            dto = json_dict_to_dto(raw_data)
+            self._cache_profile(path, dto)
+            return dto
+
+        raw_data = self._read_backup(path)
+        if raw_data is None:
+            outcome = "Будут использованы настройки по умолчанию."
+        else:
+            outcome = (
+                "Настройки восстановлены из резервной копии.\n"
+                f"Файл: {_backup_path(path)}"
+            )
+        self.warnings.extend(f"{problem}\n{outcome}" for problem in problems)
+
+        return default_dto() if raw_data is None else json_dict_to_dto(raw_data)
+
+    def _read_settings_dict(
+        self, path: Path, problems: list[str]
+    ) -> dict[str, Any] | None:
+        """Читает словарь настроек; при ошибке дополняет problems и возвращает None."""
+        problem = self._settings_file_problem(path)
+        if problem is not None:
+            problems.append(problem)
+            return None
 
         try:
-            raw_data = json.loads(path.read_text(encoding="utf-8"))
+            raw = path.read_bytes()
+            raw_data = json.loads(raw.decode("utf-8"))
         except (OSError, UnicodeDecodeError, json.JSONDecodeError) as err:
-            self._warn_bad_settings_file(path, err)
-            return default_dto()
+            problems.append(self._bad_settings_file_problem(path, err))
+            return None
+
+        if not isinstance(raw_data, dict):
+            problems.append(self._invalid_settings_structure_problem(path))
+            return None
+
+        self._remember(path, raw)
+        return raw_data
+
+    def _read_backup(self, path: Path) -> dict[str, Any] | None:
+        """Читает резервную копию файла настроек, если она есть и исправна."""
+        backup = _backup_path(path)
+        try:
+            raw_data = json.loads(backup.read_text(encoding="utf-8"))
+        except (OSError, UnicodeDecodeError, json.JSONDecodeError):
+            return None
 
         if not isinstance(raw_data, dict):
-            self._warn_invalid_settings_structure(path)
-            return default_dto()
+            return None
 
-        return json_dict_to_dto(raw_data)
+        return raw_data
 
-    def _is_readable_settings_file(self, path: Path) -> bool:
+    @staticmethod
+    def _settings_file_problem(path: Path) -> str | None:
         """
         Проверяет, что путь существует и является файлом.
-        При ошибке добавляет предупреждение.
+        Возвращает описание проблемы или None.
         """
         if not path.exists():
-            self.warnings.append(
-                "Файл настроек не найден.\n"
-                f"Файл: {path}\n"
-                "Будут использованы настройки по умолчанию."
-            )
-            return False
+            return f"Файл настроек не найден.\nФайл: {path}"
 
         if not path.is_file():
-            self.warnings.append(
-                "Путь настроек не является файлом.\n"
-                f"Путь: {path}\n"
-                "Будут использованы настройки по умолчанию."
-            )
-            return False
+            return f"Путь настроек не является файлом.\nПуть: {path}"
 
-        return True
+        return None
 
-    def _warn_bad_settings_file(self, path: Path, err: Exception) -> None:
-        """
-        Добавляет предупреждение о недоступном или повреждённом файле настроек.
-        """
+    def _warn_save_failed(self, path: Path) -> None:
         self.warnings.append(
-            "Файл настроек недоступен или повреждён.\n"
+            "Не удалось сохранить файл настроек.\n"
             f"Файл: {path}\n"
-            f"Причина: {err}\n"
-            "Будут использованы настройки по умолчанию."
+            "Изменения будут действовать до завершения программы, "
+            "но могут быть потеряны после перезапуска."
         )
 
-    def _warn_invalid_settings_structure(self, path: Path) -> None:
+    @staticmethod
+    def _bad_settings_file_problem(path: Path, err: Exception) -> str:
         """
-        Добавляет предупреждение о неверной структуре файла настроек.
+        Описание недоступного или повреждённого файла настроек.
         """
-        self.warnings.append(
-            "Файл настроек содержит некорректную структуру.\n"
-            f"Файл: {path}\n"
-            "Будут использованы настройки по умолчанию."
-        )
+        return f"Файл настроек недоступен или повреждён.\nФайл: {path}\nПричина: {err}"
+
+    @staticmethod
+    def _invalid_settings_structure_problem(path: Path) -> str:
+        """
+        Описание файла настроек с неверной структурой.
+        """
+        return f"Файл настроек содержит некорректную структуру.\nФайл: {path}"
+
+
+def _digest(raw: bytes) -> bytes:
+    return hashlib.blake2b(raw, digest_size=16).digest()
+
+
+def _backup_path(path: Path) -> Path:
+    return path.with_name(path.name + BACKUP_SUFFIX)
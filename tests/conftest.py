@@ -3,8 +3,18 @@ from __future__ import annotations
 import sys
 from pathlib import Path
 
+import pytest
+from PyQt6.QtCore import QCoreApplication
+
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 SRC_DIR = PROJECT_ROOT / "src"
 
 if str(SRC_DIR) not in sys.path:
     sys.path.insert(0, str(SRC_DIR))
+
+
+@pytest.fixture(scope="session")
+def qt_app() -> QCoreApplication:
+    """Экземпляр QCoreApplication для тестов с QTimer и QThread."""
+    instance = QCoreApplication.instance()
+    return instance if instance is not None else QCoreApplication([])
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from timer_2.announcement_queue import Announcement, AnnouncementQueue
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def announcement(
+    text: str,
+    clock: FakeClock,
+    *,
+    max_delay: float = 1.0,
+    urgent: bool = False,
+) -> Announcement:
+    return Announcement(
+        text=text,
+        fragments=(),
+        queued_at=clock.now,
+        deadline=clock.now + max_delay,
+        urgent=urgent,
+    )
+
+
+def make_queue(clock: FakeClock, maxsize: int = 2) -> AnnouncementQueue:
+    return AnnouncementQueue(maxsize=maxsize, late_ms=500, clock=clock)
+
+
+def test_newer_announcement_replaces_pending_one() -> None:
+    clock = FakeClock()
+    queue = make_queue(clock)
+
+    queue.put(announcement("десять", clock))
+    queue.put(announcement("пять", clock))
+
+    item = queue.get()
+    assert item is not None and item.text == "пять"
+    assert len(queue) == 0
+    assert queue.stats.replaced == 1
+
+
+def test_stale_announcement_is_not_returned() -> None:
+    clock = FakeClock()
+    queue = make_queue(clock)
+    queue.put(announcement("десять", clock, max_delay=1.0))
+    queue.close()
+
+    clock.now += 2.0
+
+    assert queue.get() is None
+    assert queue.stats.dropped_stale == 1
+
+
+def test_urgent_announcement_goes_first_and_survives_regular_one() -> None:
+    clock = FakeClock()
+    queue = make_queue(clock)
+
+    queue.put(announcement("девять", clock, urgent=True))
+    queue.put(announcement("обычное", clock))
+
+    first, second = queue.get(), queue.get()
+    assert first is not None and first.text == "девять"
+    assert second is not None and second.text == "обычное"
+    assert queue.stats.replaced == 0
+
+
+def test_full_queue_drops_oldest_announcement() -> None:
+    clock = FakeClock()
+    queue = make_queue(clock, maxsize=1)
+
+    queue.put(announcement("шесть", clock, urgent=True))
+    queue.put(announcement("обычное", clock))
+
+    item = queue.get()
+    assert item is not None and item.text == "обычное"
+    assert queue.stats.dropped_full == 1
+
+
+def test_late_announcement_is_counted() -> None:
+    clock = FakeClock()
+    queue = make_queue(clock)
+    queue.put(announcement("десять", clock, max_delay=2.0))
+
+    clock.now += 0.8
+
+    assert queue.get() is not None
+    assert queue.stats.late == 1
+
+
+def test_closed_queue_returns_remaining_items_then_none() -> None:
+    clock = FakeClock()
+    queue = make_queue(clock)
+    queue.put(announcement("десять", clock))
+    queue.close()
+
+    item = queue.get()
+    assert item is not None and item.text == "десять"
+    assert queue.get() is None
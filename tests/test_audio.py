@@ -0,0 +1,99 @@
+from array import array
+from pathlib import Path
+
+import pytest
+
+from timer_2 import audio
+from timer_2.audio import SILENCE_THRESHOLD, MelodyPlayer, trim_silence
+
+
+class FakeChannel:
+    def __init__(self) -> None:
+        self.busy = True
+
+    def get_busy(self) -> bool:
+        return self.busy
+
+
+class FakeSound:
+    """Замена pygame.mixer.Sound: файл с именем bad.mp3 не декодируется."""
+
+    def __init__(self, path: str) -> None:
+        if Path(path).name == "bad.mp3":
+            raise OSError("не удалось декодировать")
+        self.channel = FakeChannel()
+
+    def get_length(self) -> float:
+        return 2.0
+
+    def play(self) -> FakeChannel:
+        return self.channel
+
+
+@pytest.fixture
+def fake_mixer(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(audio, "ensure_mixer", lambda: None)
+    monkeypatch.setattr(audio.pygame.mixer, "Sound", FakeSound)
+
+
+def pcm(*samples: int) -> bytes:
+    return array("h", samples).tobytes()
+
+
+def test_trim_silence_keeps_whole_frames_between_loud_samples() -> None:
+    loud = SILENCE_THRESHOLD + 1
+    raw = pcm(0, 0, 0, loud, 5, 5, -loud, 0, 0, 0)
+
+    assert trim_silence(raw, channels=2) == pcm(0, loud, 5, 5, -loud, 0)
+
+
+def test_trim_silence_of_silent_clip_is_empty() -> None:
+    assert trim_silence(pcm(1, -1, 0, 0), channels=1) == b""
+
+
+@pytest.mark.usefixtures("fake_mixer")
+def test_melody_plays_prepared_sound_and_reports_remaining_time() -> None:
+    errors: list[Exception] = []
+    player = MelodyPlayer(on_error=errors.append)
+
+    player.prepare(Path("good.mp3"))
+    player.play()
+
+    assert errors == []
+    assert player.is_playing()
+    assert 1900 <= player.remaining_ms() <= 2000
+
+
+@pytest.mark.usefixtures("fake_mixer")
+def test_melody_remaining_time_is_zero_after_channel_stops() -> None:
+    player = MelodyPlayer(on_error=lambda err: None)
+    player.prepare(Path("good.mp3"))
+    player.play()
+
+    assert player._channel is not None
+    player._channel.busy = False
+
+    assert not player.is_playing()
+    assert player.remaining_ms() == 0
+
+
+@pytest.mark.usefixtures("fake_mixer")
+def test_melody_load_error_is_reported_and_raised_on_play() -> None:
+    errors: list[Exception] = []
+    player = MelodyPlayer(on_error=errors.append)
+
+    player.prepare(Path("bad.mp3"))
+
+    with pytest.raises(OSError, match="декодировать"):
+        player.play()
+    assert len(errors) == 1
+    assert isinstance(errors[0], OSError)
+
+
+def test_melody_play_without_prepare_raises() -> None:
+    player = MelodyPlayer(on_error=lambda err: None)
+
+    with pytest.raises(RuntimeError):
+        player.play()
+
+    assert player.remaining_ms() == 0
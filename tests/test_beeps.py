@@ -0,0 +1,32 @@
+from array import array
+
+from timer_2.beeps import TONE_MS, beep_schedule, render_beeps
+
+
+def test_beep_schedule_matches_clock_condition() -> None:
+    seconds_left, period, interval = 10, 11, 3
+
+    expected = [
+        seconds
+        for seconds in range(seconds_left, 0, -1)
+        if seconds < period and seconds % interval == 0
+    ]
+
+    assert beep_schedule(seconds_left, period, interval) == expected == [9, 6, 3]
+
+
+def test_beep_schedule_starts_inside_final_period() -> None:
+    assert beep_schedule(100, 11, 5) == [10, 5]
+
+
+def test_render_beeps_places_tones_at_exact_sample_offsets() -> None:
+    frequency, channels = 8000, 2
+    samples = array("h", render_beeps([0, 1000], frequency, channels))
+
+    tone_frames = TONE_MS * frequency // 1000
+    second_start = 1000 * frequency // 1000 * channels
+
+    assert len(samples) == second_start + tone_frames * channels
+    assert any(samples[:second_start])
+    assert not any(samples[tone_frames * channels : second_start])
+    assert samples[second_start:] == samples[: tone_frames * channels]
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from timer_2.clip_cache import ClipCache, ClipRenderer
+
+
+def write_bytes(size: int) -> ClipRenderer:
+    def render(path: Path) -> None:
+        path.write_bytes(b"x" * size)
+
+    return render
+
+
+def test_clip_key_depends_on_voice_rate_and_engine() -> None:
+    key = ClipCache.clip_key("десять секунд", voice="a", rate=200, engine="sapi5")
+
+    assert key == ClipCache.clip_key("десять секунд", "a", 200, "sapi5")
+    assert key != ClipCache.clip_key("десять секунд", "b", 200, "sapi5")
+    assert key != ClipCache.clip_key("десять секунд", "a", 150, "sapi5")
+    assert key != ClipCache.clip_key("десять секунд", "a", 200, "espeak")
+
+
+def test_put_then_get_returns_rendered_clip(tmp_path: Path) -> None:
+    cache = ClipCache(tmp_path / "clips", max_bytes=1000)
+
+    assert cache.get("k") is None
+
+    path = cache.put("k", write_bytes(10))
+
+    assert path is not None
+    assert cache.get("k") == path
+    assert path.read_bytes() == b"x" * 10
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_failed_render_is_not_cached(tmp_path: Path) -> None:
+    cache = ClipCache(tmp_path, max_bytes=1000)
+
+    def broken(path: Path) -> None:
+        path.write_bytes(b"")
+
+    assert cache.put("k", broken) is None
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_evicts_least_recently_used_clips(tmp_path: Path) -> None:
+    cache = ClipCache(tmp_path, max_bytes=25)
+    old = cache.put("old", write_bytes(10))
+    used = cache.put("used", write_bytes(10))
+    assert old is not None and used is not None
+    os.utime(old, ns=(1_000_000_000, 1_000_000_000))
+    os.utime(used, ns=(2_000_000_000, 2_000_000_000))
+    cache.get("used")
+
+    cache.put("new", write_bytes(10))
+
+    assert not old.exists()
+    assert used.exists()
+    assert cache.path_for("new").exists()
+    assert cache.evictions == 1
@@ -0,0 +1,240 @@
+from types import SimpleNamespace
+
+import pytest
+
+from timer_2.clock import Clock
+from timer_2.const import Const as C
+from timer_2.precise_timer import CatchUp
+from timer_2.time_source import VirtualTimeSource
+from timer_2.tunes_defaults import default_model
+
+type Event = tuple[str, int | None]
+
+
+def make_clock(
+    seconds_left: int, voice_interval: int, beep_period_in_final: int = 0
+) -> tuple[Clock, VirtualTimeSource, list[Event]]:
+    model = default_model()
+    model.voice_interval = voice_interval
+    model.beep_period_in_final = beep_period_in_final
+    source = VirtualTimeSource()
+
+    clock = Clock(seconds_left, SimpleNamespace(model=model), time_source=source)  # type: ignore[arg-type]
+    events: list[Event] = []
+    clock.connect("draw_time", lambda seconds: events.append(("draw", seconds)))
+    clock.connect("inform_voice", lambda seconds: events.append(("voice", seconds)))
+    clock.connect("inform_done", lambda: events.append(("done", None)))
+    clock.beep = lambda: events.append(("beep", clock.seconds_left))
+    return clock, source, events
+
+
+def set_catch_up(clock: Clock, catch_up: CatchUp) -> None:
+    assert clock.timer is not None
+    clock.catch_up = clock.timer.catch_up = catch_up
+
+
+def test_extra_ticks_do_not_shift_countdown() -> None:
+    clock, source, events = make_clock(10, voice_interval=100)
+
+    clock.start()
+    source.advance(1)
+    clock.on_time_out()
+    clock.on_time_out()
+    source.advance(1)
+
+    assert events == [("draw", 9), ("draw", 8)]
+
+
+def test_short_stall_drops_skipped_announcements() -> None:
+    clock, source, events = make_clock(10, voice_interval=2)
+    set_catch_up(clock, CatchUp.SKIP)
+
+    clock.start()
+    source.advance(1)
+    source.block(2)
+    source.advance(0)
+
+    assert events == [("draw", 9), ("draw", 7)]
+    assert clock.skipped_seconds == 1
+    assert clock.time_jumps == 0
+
+
+def test_coalesced_stall_announces_current_time_once() -> None:
+    clock, source, events = make_clock(10, voice_interval=2)
+    set_catch_up(clock, CatchUp.COALESCE)
+
+    clock.start()
+    source.advance(1)
+    source.block(2)
+    source.advance(1)
+
+    assert events == [("draw", 9), ("draw", 7), ("voice", 7), ("draw", 6), ("voice", 6)]
+    assert clock.skipped_seconds == 1
+    assert clock.time_jumps == 0
+
+
+def test_time_jump_announces_current_remaining_time() -> None:
+    clock, source, events = make_clock(600, voice_interval=60)
+
+    clock.start()
+    source.advance(1)
+    source.block(250)
+    source.advance(1)
+
+    assert events == [("draw", 599), ("draw", 349), ("voice", 349), ("draw", 348)]
+    assert clock.time_jumps == 1
+
+
+def test_deadline_passed_during_jump_finishes_timer() -> None:
+    clock, source, events = make_clock(60, voice_interval=10)
+
+    clock.start()
+    source.block(3600)
+    source.run()
+
+    assert events == [("draw", 0), ("done", None)]
+    assert len(source) == 0
+
+
+def test_late_last_tick_does_not_finish_before_deadline() -> None:
+    clock, source, events = make_clock(2, voice_interval=100)
+    set_catch_up(clock, CatchUp.SKIP)
+
+    clock.start()
+    source.block(1.6)
+    source.advance(0)
+
+    assert events == [("draw", 1)]
+
+    source.run()
+
+    assert events == [("draw", 1), ("draw", 0), ("done", None)]
+    assert source.now() >= clock.deadline
+
+
+def test_full_day_replays_in_virtual_time() -> None:
+    seconds = 24 * C.SECONDS_IN_HOUR
+    model = default_model()
+    source = VirtualTimeSource()
+    clock = Clock(seconds, SimpleNamespace(model=model), time_source=source)  # type: ignore[arg-type]
+    draws: list[int] = []
+    timeline: list[tuple[str, int | None, float]] = []
+    clock.connect("draw_time", draws.append)
+    clock.connect(
+        "inform_voice", lambda left: timeline.append(("voice", left, source.now()))
+    )
+    clock.connect("inform_done", lambda: timeline.append(("done", None, source.now())))
+    clock.beep = lambda: timeline.append(("beep", clock.seconds_left, source.now()))
+
+    clock.start()
+    source.run()
+
+    voices = [event for event in timeline if event[0] == "voice"]
+    beeps = [event for event in timeline if event[0] == "beep"]
+    assert voices == [
+        ("voice", left, seconds - left)
+        for left in range(seconds - model.voice_interval, 0, -model.voice_interval)
+    ]
+    assert beeps == [("beep", left, seconds - left) for left in (9, 6, 3)]
+    assert timeline[-1] == ("done", None, seconds)
+    assert draws == list(range(seconds - 1, -1, -1))
+
+
+def test_hidden_event_driven_clock_wakes_only_for_events(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(C, "CLOCK_EVENT_DRIVEN", True)
+    clock, source, events = make_clock(3600, 300, beep_period_in_final=11)
+
+    clock.set_visible(False)
+    clock.start()
+    source.run()
+
+    voices = [event for event in events if event[0] == "voice"]
+    beeps = [event for event in events if event[0] == "beep"]
+    assert voices == [("voice", left) for left in range(3300, 0, -300)]
+    assert beeps == [("beep", 9), ("beep", 6), ("beep", 3)]
+    assert events[-1] == ("done", None)
+    assert clock.skipped_seconds == 0
+    assert clock.wakeups == len(voices) + len(beeps) + 1
+
+
+def test_hidden_clock_with_precise_timer_sleeps_until_events() -> None:
+    clock, source, events = make_clock(3600, 300, beep_period_in_final=11)
+
+    clock.start()
+    source.advance(0.5)
+    clock.set_visible(False)
+    wakeups = clock.wakeups
+    source.advance(3000)
+
+    voices = [event for event in events if event[0] == "voice"]
+    assert voices == [("voice", left) for left in range(3300, 599, -300)]
+    assert clock.wakeups - wakeups == len(voices)
+
+    events.clear()
+    clock.set_visible(True)
+    source.advance(3)
+
+    assert events == [("draw", 599), ("draw", 598), ("draw", 597)]
+
+    source.run()
+
+    assert events[-1] == ("done", None)
+    assert source.now() == pytest.approx(3600)
+    assert clock.skipped_seconds == 0
+
+
+def test_tenths_refresh_reuses_one_timer_handle(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(C, "TENTHS_IN_FINAL", True)
+    clock, source, events = make_clock(6, 100, beep_period_in_final=5)
+    clock.beep = lambda: None
+    clock.connect("draw_tenths", lambda tenths: events.append(("tenths", tenths)))
+
+    clock.start()
+    source.advance(2.05)
+    handle = clock.tenths
+    source.advance(0.5)
+
+    assert handle is not None
+    assert clock.tenths is handle
+    assert handle.is_active()
+    assert events.count(("tenths", 35)) == 1
+
+
+def test_tenths_are_shown_only_in_visible_final_period(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(C, "TENTHS_IN_FINAL", True)
+    clock, source, events = make_clock(6, 100, beep_period_in_final=5)
+    clock.beep = lambda: None
+    clock.connect("draw_tenths", lambda tenths: events.append(("tenths", tenths)))
+
+    clock.start()
+    source.advance(2.35)
+    clock.set_visible(False)
+    source.advance(0.65)
+
+    assert events == [
+        ("draw", 5),
+        ("tenths", 40),
+        ("tenths", 39),
+        ("tenths", 38),
+        ("tenths", 37),
+        ("draw", 3),
+    ]
+
+
+def test_cancel_drops_voice_messages_started_ahead() -> None:
+    clock, source, events = make_clock(30, voice_interval=10)
+    clock.set_voice_lead(lambda: 1500.0)
+
+    clock.start()
+    source.advance(8.2)
+    clock.cancel()
+    source.run()
+
+    assert ("voice", 20) not in events
+    assert len(source) == 0
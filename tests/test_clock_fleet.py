@@ -0,0 +1,81 @@
+from collections.abc import Callable
+
+from timer_2.clock_fleet import ClockFleet
+
+
+def collect(fleet: ClockFleet) -> list[tuple[str, int, int]]:
+    events: list[tuple[str, int, int]] = []
+
+    def recorder(name: str) -> Callable[[int, int], None]:
+        return lambda index, seconds: events.append((name, index, seconds))
+
+    for name in ("inform_voice", "inform_beep", "inform_done"):
+        fleet.connect(name, recorder(name))
+    return events
+
+
+def test_events_match_single_clock_rules() -> None:
+    fleet = ClockFleet()
+    events = collect(fleet)
+    fleet.add(seconds_left=7, voice_interval=3, beep_interval=2, beep_period_in_final=5)
+
+    for _ in range(7):
+        fleet.tick()
+
+    assert events == [
+        ("inform_voice", 0, 6),
+        ("inform_beep", 0, 4),
+        ("inform_voice", 0, 3),
+        ("inform_beep", 0, 2),
+        ("inform_done", 0, 0),
+    ]
+    assert len(fleet) == 0
+
+
+def test_finished_and_cancelled_clocks_stop_ticking() -> None:
+    fleet = ClockFleet()
+    events = collect(fleet)
+    short = fleet.add(1, 1, 1, 0)
+    cancelled = fleet.add(10, 1, 1, 0)
+    running = fleet.add(10, 5, 1, 0)
+
+    fleet.cancel(cancelled)
+    for _ in range(3):
+        fleet.tick()
+
+    assert events == [("inform_done", short, 0)]
+    assert fleet.seconds_left[short] == 0
+    assert fleet.seconds_left[cancelled] == 10
+    assert fleet.seconds_left[running] == 7
+
+
+def test_fleet_grows_beyond_initial_capacity() -> None:
+    fleet = ClockFleet(capacity=2)
+    events = collect(fleet)
+    indexes = [fleet.add(seconds, 100, 1, 0) for seconds in range(1, 6)]
+
+    fleet.tick()
+
+    assert indexes == [0, 1, 2, 3, 4]
+    assert events == [("inform_done", 0, 0)]
+    assert len(fleet) == 4
+
+
+def test_slots_of_finished_and_cancelled_clocks_are_reused() -> None:
+    fleet = ClockFleet(capacity=4)
+    done: list[int] = []
+    fleet.connect("inform_done", lambda index, seconds: done.append(index))
+
+    for _ in range(1000):
+        finishing = [fleet.add(2, 100, 1, 0) for _ in range(3)]
+        cancelled = fleet.add(50, 100, 1, 0)
+        fleet.cancel(cancelled)
+        fleet.cancel(cancelled)
+        fleet.tick()
+        fleet.tick()
+        assert sorted(done[-3:]) == sorted(finishing)
+
+    assert fleet.size == 4
+    assert len(fleet.seconds_left) == 4
+    assert len(fleet) == 0
+    assert len(done) == 3000
@@ -0,0 +1,86 @@
+from types import SimpleNamespace
+
+from timer_2.clock import Clock
+from timer_2.clock_scheduler import ClockScheduler
+from timer_2.time_source import VirtualTimeSource
+from timer_2.tunes_defaults import default_model
+
+
+def make_scheduler() -> tuple[ClockScheduler, VirtualTimeSource]:
+    source = VirtualTimeSource()
+    return ClockScheduler(time_source=source), source
+
+
+def add_clock(
+    scheduler: ClockScheduler, source: VirtualTimeSource, seconds: int
+) -> tuple[Clock, list[int | None]]:
+    model = default_model()
+    model.voice_interval = 59
+    model.beep_period_in_final = 1
+    clock = Clock(seconds, SimpleNamespace(model=model), scheduler=scheduler)  # type: ignore[arg-type]
+    assert clock.source is source
+    events: list[int | None] = []
+    clock.connect("draw_time", events.append)
+    clock.connect("inform_voice", lambda seconds: None)
+    clock.connect("inform_done", lambda: events.append(None))
+    clock.beep = lambda: None
+    clock.start()
+    return clock, events
+
+
+def test_finished_clocks_leave_scheduler_and_heap_consistent() -> None:
+    scheduler, source = make_scheduler()
+    long = [add_clock(scheduler, source, 10) for _ in range(6)]
+    short = [add_clock(scheduler, source, 3) for _ in range(3)]
+
+    source.run_until(5)
+
+    assert all(events[-2:] == [0, None] for _, events in short)
+    assert len(scheduler) == len(scheduler.heap) == 6
+
+    source.run_until(11)
+
+    assert all(events == [*range(9, -1, -1), None] for _, events in long)
+    assert len(scheduler) == len(scheduler.heap) == 0
+    assert scheduler.heap._cancelled == 0
+    assert scheduler.handle is None
+    assert len(source) == 0
+
+
+def test_cancelled_clock_gets_no_more_ticks() -> None:
+    scheduler, source = make_scheduler()
+    clock, events = add_clock(scheduler, source, 10)
+    other, other_events = add_clock(scheduler, source, 10)
+
+    source.run_until(2)
+    clock.cancel()
+    source.run_until(5)
+
+    assert events == [9, 8]
+    assert other_events == [9, 8, 7, 6, 5]
+    assert len(scheduler) == len(scheduler.heap) == 1
+
+
+def test_ticks_of_clocks_within_tolerance_share_one_wakeup() -> None:
+    scheduler, source = make_scheduler()
+    for _ in range(50):
+        add_clock(scheduler, source, 60)
+        source.advance(0.0001)
+    wakeups = scheduler.wakeups
+
+    source.run_until(5.5)
+
+    assert scheduler.wakeups - wakeups == 5
+
+
+def test_ticks_far_apart_wake_separately() -> None:
+    scheduler, source = make_scheduler()
+    for _ in range(3):
+        add_clock(scheduler, source, 60)
+        source.advance(0.1)
+
+    source.run_until(0.5)
+    wakeups = scheduler.wakeups
+    source.run_until(3.5)
+
+    assert scheduler.wakeups - wakeups == 3 * 3
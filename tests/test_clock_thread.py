@@ -0,0 +1,98 @@
+import threading
+from collections.abc import Callable
+from types import SimpleNamespace
+
+import pytest
+from PyQt6.QtCore import QCoreApplication, QEventLoop, QTimer
+
+from timer_2 import functions
+from timer_2.clock_thread import ClockThread
+from timer_2.tunes_defaults import default_model
+
+type Event = tuple[str, int | None, int]
+
+
+def wait_until(condition: Callable[[], bool], timeout_ms: int) -> None:
+    """Обрабатывает события GUI, пока condition() не станет истинным."""
+    loop = QEventLoop()
+
+    def check() -> None:
+        if condition():
+            loop.quit()
+
+    poll = QTimer()
+    poll.timeout.connect(check)
+    poll.start(10)
+    QTimer.singleShot(timeout_ms, loop.quit)
+    loop.exec()
+    poll.stop()
+
+
+def make_thread(
+    seconds_left: int, monkeypatch: pytest.MonkeyPatch
+) -> tuple[ClockThread, list[Event]]:
+    events: list[Event] = []
+    monkeypatch.setattr(
+        functions,
+        "inform_fatal_error_and_quit",
+        lambda title, text: events.append(("error", None, threading.get_ident())),
+    )
+    model = default_model()
+    model.beep_period_in_final = 0
+    clock = ClockThread(seconds_left, SimpleNamespace(model=model))  # type: ignore[arg-type]
+
+    def record(name: str, seconds: int | None = None) -> None:
+        events.append((name, seconds, threading.get_ident()))
+
+    clock.connect("draw_time", lambda seconds: record("draw", seconds))
+    clock.connect("inform_voice", lambda seconds: record("voice", seconds))
+    clock.connect("inform_done", lambda: record("done"))
+    return clock, events
+
+
+def test_events_arrive_on_gui_thread_and_thread_stops(
+    qt_app: QCoreApplication, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    clock, events = make_thread(1, monkeypatch)
+
+    clock.start()
+    wait_until(lambda: any(event[0] == "done" for event in events), 5000)
+    clock.cancel()
+
+    gui = threading.get_ident()
+    assert [event[:2] for event in events] == [("draw", 0), ("done", None)]
+    assert all(event[2] == gui for event in events)
+    assert not clock.worker_thread.isRunning()
+
+
+def test_cancel_stops_running_clock(
+    qt_app: QCoreApplication, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    clock, events = make_thread(60, monkeypatch)
+
+    clock.start()
+    wait_until(lambda: clock.worker.clock is not None, 5000)
+    clock.cancel()
+    count = len(events)
+    wait_until(lambda: False, 1200)
+
+    assert not clock.worker_thread.isRunning()
+    assert len(events) == count
+
+
+def test_clock_errors_are_reported_on_gui_thread(
+    qt_app: QCoreApplication, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    clock, events = make_thread(60, monkeypatch)
+    clock.start()
+    wait_until(lambda: clock.worker.clock is not None, 5000)
+    worker_clock = clock.worker.clock
+    assert worker_clock is not None
+
+    reporter = threading.Thread(target=worker_clock.on_error, args=("title", "text"))
+    reporter.start()
+    reporter.join()
+    wait_until(lambda: bool(events), 2000)
+    clock.cancel()
+
+    assert events == [("error", None, threading.get_ident())]
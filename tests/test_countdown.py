@@ -0,0 +1,82 @@
+import asyncio
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from timer_2.countdown import CountdownEngine
+from timer_2.time_source import AsyncioTimeSource
+from timer_2.tunes_defaults import default_model
+
+
+def test_countdown_module_does_not_import_qt() -> None:
+    code = (
+        "import sys, timer_2.countdown;"
+        "print(any(m.startswith('PyQt6') for m in sys.modules))"
+    )
+    src = Path(__file__).resolve().parents[1] / "src"
+    env = {**os.environ, "PYTHONPATH": str(src)}
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=env,
+    )
+
+    assert result.stdout.strip() == "False"
+
+
+def test_asyncio_source_runs_calls_in_time_order() -> None:
+    async def scenario() -> list[str]:
+        source = AsyncioTimeSource()
+        calls: list[str] = []
+        source.call_later(30, lambda: calls.append("b"))
+        source.call_later(10, lambda: calls.append("a"))
+        cancelled = source.call_later(20, lambda: calls.append("x"))
+        cancelled.cancel()
+        await asyncio.sleep(0.05)
+        assert not cancelled.is_active()
+        return calls
+
+    assert asyncio.run(scenario()) == ["a", "b"]
+
+
+def test_engine_counts_down_and_finishes() -> None:
+    model = default_model()
+    model.voice_interval = 1
+    model.beep_period_in_final = 0
+    events: list[tuple[str, int | None]] = []
+
+    async def scenario() -> float:
+        engine = CountdownEngine(2, model)
+        engine.connect("draw_time", lambda seconds: events.append(("draw", seconds)))
+        engine.connect(
+            "inform_voice", lambda seconds: events.append(("voice", seconds))
+        )
+        engine.connect("inform_done", lambda: events.append(("done", None)))
+        started = engine.source.now()
+        await engine.run()
+        return engine.source.now() - started
+
+    elapsed = asyncio.run(scenario())
+
+    assert events == [("draw", 1), ("voice", 1), ("draw", 0), ("done", None)]
+    assert 1.9 < elapsed < 2.5
+
+
+def test_handler_error_is_raised_from_run() -> None:
+    model = default_model()
+
+    def fail(seconds: int) -> None:
+        raise ValueError(seconds)
+
+    async def scenario() -> None:
+        engine = CountdownEngine(5, model)
+        engine.connect("draw_time", fail)
+        await engine.run()
+
+    with pytest.raises(RuntimeError, match="draw_time"):
+        asyncio.run(scenario())
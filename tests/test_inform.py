@@ -0,0 +1,61 @@
+import time
+
+import pytest
+from PyQt6.QtCore import QTimer
+
+from timer_2.const import Const as C
+from timer_2.inform import InformTime
+
+pytestmark = pytest.mark.usefixtures("qt_app")
+
+
+class FakeMelody:
+    """Мелодия, которая ещё звучит при первых busy_checks проверках."""
+
+    def __init__(self, remaining_ms: int, busy_checks: int) -> None:
+        self._remaining_ms = remaining_ms
+        self.busy_checks = busy_checks
+        self.checks = 0
+
+    def remaining_ms(self) -> int:
+        return self._remaining_ms
+
+    def is_playing(self) -> bool:
+        self.checks += 1
+        return self.checks <= self.busy_checks
+
+
+def make_inform(melody: FakeMelody) -> InformTime:
+    """InformTime без речи и микшера: нужны только проверки окончания."""
+    inform = object.__new__(InformTime)
+    inform.melody = melody  # type: ignore[assignment]
+    return inform
+
+
+def wait_for_end(inform: InformTime) -> float:
+    guard = QTimer()
+    guard.setSingleShot(True)
+    guard.timeout.connect(lambda: pytest.fail("мелодия не закончилась"))
+    guard.start(3000)
+    started = time.perf_counter()
+    inform.control_end_of_melody()
+    guard.stop()
+    return (time.perf_counter() - started) * 1000
+
+
+def test_end_of_melody_is_checked_once_at_expected_moment() -> None:
+    melody = FakeMelody(remaining_ms=50, busy_checks=0)
+
+    elapsed = wait_for_end(make_inform(melody))
+
+    assert melody.checks == 1
+    assert 45 <= elapsed < 50 + C.END_CHECK_INTERVAL
+
+
+def test_end_of_melody_is_rechecked_while_buffer_drains() -> None:
+    melody = FakeMelody(remaining_ms=50, busy_checks=1)
+
+    elapsed = wait_for_end(make_inform(melody))
+
+    assert melody.checks == 2
+    assert elapsed >= 45 + C.END_CHECK_INTERVAL
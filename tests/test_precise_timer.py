@@ -0,0 +1,65 @@
+import pytest
+
+from timer_2.precise_timer import CatchUp, PreciseTimer
+from timer_2.time_source import VirtualTimeSource
+
+
+def make_timer(
+    catch_up: CatchUp,
+) -> tuple[PreciseTimer, VirtualTimeSource, list[float]]:
+    source = VirtualTimeSource()
+    ticks: list[float] = []
+    timer = PreciseTimer(1000, lambda: ticks.append(source.now()), catch_up, source)
+    return timer, source, ticks
+
+
+def test_first_tick_is_immediate_and_next_follow_on_grid() -> None:
+    timer, source, ticks = make_timer(CatchUp.SKIP)
+
+    timer.start()
+    source.advance(3.5)
+
+    assert ticks == [0, 1, 2, 3]
+
+
+def test_burst_replays_every_missed_tick() -> None:
+    timer, source, ticks = make_timer(CatchUp.BURST)
+
+    timer.start()
+    source.advance(1)
+    source.block(3.2)
+    source.advance(0)
+
+    assert ticks == [0, 1, 4.2, 4.2, 4.2]
+    assert timer.coalesced_ticks == 0
+
+
+@pytest.mark.parametrize("catch_up", [CatchUp.SKIP, CatchUp.COALESCE])
+def test_missed_ticks_collapse_into_one(catch_up: CatchUp) -> None:
+    timer, source, ticks = make_timer(catch_up)
+
+    timer.start()
+    source.advance(1)
+    source.block(3.2)
+    source.advance(1)
+
+    assert ticks == [0, 1, 4.2, 5]
+    assert timer.coalesced_ticks == 2
+    assert timer.stats.max() == pytest.approx(2200)
+
+
+def test_stop_from_callback_ends_ticking() -> None:
+    source = VirtualTimeSource()
+    ticks: list[float] = []
+
+    def on_tick() -> None:
+        ticks.append(source.now())
+        if len(ticks) == 2:
+            timer.stop()
+
+    timer = PreciseTimer(1000, on_tick, CatchUp.SKIP, source)
+    timer.start()
+    source.run()
+
+    assert ticks == [0, 1]
+    assert len(source) == 0
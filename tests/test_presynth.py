@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from timer_2.clip_cache import ClipCache
+from timer_2.presynth import PreSynthesizer, announcement_schedule
+
+
+class FakeEngine:
+    driver_name = "fake"
+
+    def __init__(self) -> None:
+        self.rendered: list[str] = []
+
+    def getProperty(self, name: str) -> object:  # noqa: N802 - имя из API pyttsx3
+        return {"voice": "ru", "rate": 200}[name]
+
+    def save_to_file(self, text: str, filename: str) -> None:
+        self.rendered.append(text)
+        Path(filename).write_text(text, encoding="utf-8")
+
+    def runAndWait(self) -> None:  # noqa: N802 - имя из API pyttsx3
+        pass
+
+
+def test_schedule_lists_announcements_nearest_first() -> None:
+    assert announcement_schedule(35, 10) == [30, 20, 10]
+    assert announcement_schedule(30, 10) == [20, 10]
+    assert announcement_schedule(5, 10) == []
+
+
+def test_schedule_matches_clock_announcements() -> None:
+    seconds_left, voice_interval = 127, 7
+
+    expected = [
+        seconds
+        for seconds in range(seconds_left - 1, 0, -1)
+        if seconds % voice_interval == 0
+    ]
+
+    assert announcement_schedule(seconds_left, voice_interval) == expected
+
+
+def test_presynth_renders_only_window_ahead(tmp_path: Path) -> None:
+    engine = FakeEngine()
+    presynth = PreSynthesizer(
+        ClipCache(tmp_path, max_bytes=10_000),
+        workers=1,
+        ahead=2,
+        engine_factory=lambda: engine,
+    )
+
+    presynth.start(["раз", "два", "два", "три", "четыре"])
+    presynth.advance()
+    assert presynth._executor is not None
+    presynth._executor.shutdown(wait=True)
+
+    assert engine.rendered == ["раз", "два", "три"]
+    assert presynth.rendered == 3
+
+
+def test_presynth_renders_requested_texts_even_after_stop(tmp_path: Path) -> None:
+    engine = FakeEngine()
+    presynth = PreSynthesizer(
+        ClipCache(tmp_path, max_bytes=10_000),
+        workers=1,
+        ahead=1,
+        engine_factory=lambda: engine,
+    )
+
+    presynth.stop()
+    presynth.request(["минуты", "секунды"])
+    assert presynth._executor is not None
+    presynth._executor.shutdown(wait=True)
+
+    assert engine.rendered == ["минуты", "секунды"]
+    assert presynth.rendered == 2
@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+import time
+from functools import partial
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from timer_2.announcement_queue import Announcement
+from timer_2.clip_cache import ClipCache
+from timer_2.speech import SpeechStats, SpeechWorker, engine_clip_key, render_clip
+
+
+class FakeEngine:
+    def __init__(self, fail_on: str | None = None) -> None:
+        self.fail_on = fail_on
+        self.spoken: list[str] = []
+        self.pending: list[str] = []
+
+    def say(self, text: str) -> None:
+        self.pending.append(text)
+
+    def runAndWait(self) -> None:  # noqa: N802 - имя из API pyttsx3
+        text = self.pending.pop()
+        if text == self.fail_on:
+            raise RuntimeError("сбой движка")
+        self.spoken.append(text)
+
+    def stop(self) -> None:
+        pass
+
+    def connect(self, topic: str, callback: Any) -> None:
+        pass
+
+    def getProperty(self, name: str) -> object:  # noqa: N802 - имя из API pyttsx3
+        return {"voice": "ru", "rate": 200}[name]
+
+    def save_to_file(self, text: str, filename: str) -> None:
+        self.pending.append(text)
+        Path(filename).write_text(text, encoding="utf-8")
+
+
+def test_worker_speaks_queued_message_before_stop() -> None:
+    engine = FakeEngine()
+    worker = SpeechWorker(lambda: engine)
+
+    worker.start()
+    worker.say("десять секунд")
+    worker.stop(timeout=5)
+
+    assert engine.spoken == ["десять секунд"]
+    assert worker.stats.engine_inits == 1
+    assert worker.stats.messages == 1
+
+
+def test_worker_recreates_engine_only_after_failure() -> None:
+    engines: list[FakeEngine] = []
+
+    def factory() -> FakeEngine:
+        engine = FakeEngine(fail_on="сбой")
+        engines.append(engine)
+        return engine
+
+    worker = SpeechWorker(factory)
+    worker._speak("до сбоя")
+    worker._speak("сбой")
+    worker._speak("после сбоя")
+    worker._speak("ещё")
+
+    assert len(engines) == 2
+    assert engines[0].spoken == ["до сбоя"]
+    assert engines[1].spoken == ["после сбоя", "ещё"]
+    assert worker.stats.failures == 1
+    assert worker.stats.engine_inits == 2
+
+
+def test_worker_renders_phrase_once_and_then_plays_from_cache(
+    tmp_path: Path,
+) -> None:
+    engine = FakeEngine()
+    played: list[str] = []
+    worker = SpeechWorker(
+        lambda: engine,
+        clip_cache=ClipCache(tmp_path, max_bytes=1000),
+        play_clip=lambda path: played.append(path.read_text(encoding="utf-8")),
+    )
+
+    worker._speak("десять секунд")
+    worker._speak("десять секунд")
+
+    assert played == ["десять секунд", "десять секунд"]
+    assert engine.spoken == ["десять секунд"]
+    assert worker.stats.clip_renders == 1
+    assert worker.stats.clip_hits == 1
+
+
+def make_fragment_worker(
+    tmp_path: Path, engine: FakeEngine, rendered: tuple[str, ...]
+) -> tuple[SpeechWorker, list[list[str]], list[list[str]]]:
+    """Работник в режиме фрагментов; клипы rendered уже синтезированы."""
+    cache = ClipCache(tmp_path, max_bytes=1000)
+    for text in rendered:
+        cache.put(engine_clip_key(engine, text), partial(render_clip, engine, text))
+    engine.spoken.clear()
+
+    spliced: list[list[str]] = []
+    requested: list[list[str]] = []
+    worker = SpeechWorker(
+        lambda: engine,
+        clip_cache=cache,
+        play_clip=lambda path: pytest.fail("фраза не должна проигрываться целиком"),
+        play_fragments=lambda clips: spliced.append(
+            [clip.read_text(encoding="utf-8") for clip in clips]
+        ),
+        request_clips=requested.append,
+    )
+    return worker, spliced, requested
+
+
+def test_worker_splices_message_from_fragment_clips(tmp_path: Path) -> None:
+    engine = FakeEngine()
+    worker, spliced, _ = make_fragment_worker(
+        tmp_path, engine, ("две", "минуты", "секунды")
+    )
+
+    worker._speak("Две минуты ", ("две", "минуты"))
+    worker._speak("Две секунды ", ("две", "секунды"))
+
+    assert spliced == [["две", "минуты"], ["две", "секунды"]]
+    assert engine.spoken == []
+    assert worker.stats.clip_renders == 0
+
+
+def test_missing_fragment_is_not_synthesized_at_runtime(tmp_path: Path) -> None:
+    engine = FakeEngine()
+    worker, spliced, requested = make_fragment_worker(tmp_path, engine, ("две",))
+    cached = sorted(tmp_path.iterdir())
+
+    worker._speak("Две минуты ", ("две", "минуты"))
+
+    assert spliced == []
+    assert requested == [["минуты"]]
+    assert engine.spoken == []
+    assert engine.pending == []
+    assert sorted(tmp_path.iterdir()) == cached
+    assert worker.stats.clip_renders == 0
+    assert worker.stats.fragment_fallbacks == 1
+
+
+def test_latency_estimate_is_smoothed() -> None:
+    stats = SpeechStats()
+
+    stats.add_latency(100.0)
+    stats.add_latency(200.0)
+
+    assert stats.last_latency_ms == 200.0
+    assert 100.0 < stats.latency_ms < 200.0
+
+
+class SlowEngine(FakeEngine):
+    def save_to_file(self, text: str, filename: str) -> None:
+        time.sleep(0.05)
+        super().save_to_file(text, filename)
+
+
+def test_worker_measures_latency_until_clip_playback(tmp_path: Path) -> None:
+    engine = SlowEngine()
+    worker = SpeechWorker(
+        lambda: engine,
+        clip_cache=ClipCache(tmp_path, max_bytes=1000),
+        play_clip=lambda path: None,
+    )
+
+    worker._speak("десять секунд")
+
+    assert worker.stats.latency_ms >= 50.0
+
+
+def test_latency_does_not_include_time_waiting_in_queue(tmp_path: Path) -> None:
+    engine = FakeEngine()
+    worker = SpeechWorker(
+        lambda: engine,
+        clip_cache=ClipCache(tmp_path, max_bytes=1000),
+        play_clip=lambda path: None,
+    )
+    now = time.perf_counter()
+    worker._queue.put(
+        Announcement(
+            text="десять секунд",
+            fragments=(),
+            queued_at=now - 1.0,
+            deadline=now + 60.0,
+        )
+    )
+
+    worker.start()
+    worker.stop(timeout=5)
+
+    assert worker.stats.messages == 1
+    assert worker.stats.queue_wait_ms >= 1000.0
+    assert worker.stats.latency_ms < 500.0
@@ -0,0 +1,41 @@
+from timer_2.tick_stats import TickStats
+
+
+def test_statistics_over_recorded_ticks() -> None:
+    stats = TickStats(capacity=100, interval_ms=1000)
+    for late_ms in range(1, 101):
+        stats.record(late_ms)
+
+    assert stats.min() == 1
+    assert stats.max() == 100
+    assert stats.mean() == 50.5
+    assert stats.percentile(50) == 50
+    assert stats.percentile(99) == 99
+    assert stats.overruns == 0
+
+
+def test_ring_buffer_keeps_latest_values() -> None:
+    stats = TickStats(capacity=3, interval_ms=1000)
+    for late_ms in (5, 6, 7, 8, 1200):
+        stats.record(late_ms)
+
+    assert stats.values() == [7, 8, 1200]
+    assert len(stats) == 3
+    assert stats.count == 5
+    assert stats.overruns == 1
+
+
+def test_histogram_buckets() -> None:
+    stats = TickStats(capacity=10, interval_ms=1000)
+    for late_ms in (-1, 0, 1, 3, 15, 2000):
+        stats.record(late_ms)
+
+    assert stats.histogram((1, 10, 100)) == [2, 2, 1, 1]
+
+
+def test_empty_statistics() -> None:
+    stats = TickStats(capacity=10, interval_ms=1000)
+
+    assert stats.values() == []
+    assert stats.percentile(99) == 0.0
+    assert "тактов: 0" in stats.summary()
@@ -0,0 +1,56 @@
+from timer_2.time_source import VirtualTimeSource
+
+
+def test_calls_run_in_time_order_with_exact_now() -> None:
+    source = VirtualTimeSource()
+    calls: list[tuple[str, float]] = []
+
+    source.call_later(300, lambda: calls.append(("b", source.now())))
+    source.call_later(100, lambda: calls.append(("a", source.now())))
+    source.advance(0.2)
+
+    assert calls == [("a", 0.1)]
+    assert source.now() == 0.2
+
+    source.run()
+
+    assert calls == [("a", 0.1), ("b", 0.3)]
+
+
+def test_cancelled_call_does_not_run() -> None:
+    source = VirtualTimeSource()
+    calls: list[str] = []
+
+    handle = source.call_later(100, lambda: calls.append("x"))
+    later = source.call_later(200, lambda: calls.append("y"))
+    source.call_later(50, later.cancel)
+    handle.cancel()
+    source.run()
+
+    assert calls == []
+    assert not handle.is_active()
+
+
+def test_blocked_time_runs_overdue_calls_late() -> None:
+    source = VirtualTimeSource()
+    calls: list[float] = []
+
+    source.call_later(100, lambda: calls.append(source.now()))
+    source.block(1)
+    source.advance(0)
+
+    assert calls == [1]
+
+
+def test_restarted_call_runs_once_at_new_time() -> None:
+    source = VirtualTimeSource()
+    calls: list[float] = []
+
+    handle = source.call_later(100, lambda: calls.append(source.now()))
+    handle.restart(300)
+    source.run()
+    handle.restart(50)
+    source.run()
+
+    assert calls == [0.3, 0.35]
+    assert len(source) == 0
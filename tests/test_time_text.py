@@ -0,0 +1,32 @@
+from timer_2 import time_text as tt
+from timer_2.const import Const as C
+
+SECONDS_IN_DAY = 24 * C.SECONDS_IN_HOUR
+
+
+def test_table_text_equals_num2words_text_for_whole_day() -> None:
+    for seconds in range(SECONDS_IN_DAY):
+        assert tt.time_to_text(seconds) == tt.time_to_text_num2words(seconds)
+
+
+def test_time_to_text_examples() -> None:
+    assert tt.time_to_text(3725) == "Один час две минуты пять секунд "
+    assert tt.time_to_text(21 * 60) == "Двадцать одна минута "
+    assert tt.time_to_text(0) == ""
+
+
+def test_fragments_compose_the_same_text_for_whole_day() -> None:
+    known_fragments = set(tt.all_time_fragments())
+
+    for seconds in range(1, SECONDS_IN_DAY):
+        fragments = tt.time_to_fragments(seconds)
+
+        assert set(fragments) <= known_fragments
+        assert f"{' '.join(fragments)} ".capitalize() == tt.time_to_text(seconds)
+
+
+def test_all_time_fragments_are_unique_and_few() -> None:
+    fragments = tt.all_time_fragments()
+
+    assert len(fragments) == len(set(fragments))
+    assert len(fragments) < 100
@@ -0,0 +1,45 @@
+from timer_2.timer_heap import TimerHeap
+
+
+def test_pop_due_returns_events_in_time_order() -> None:
+    heap = TimerHeap()
+    heap.push(300, "c")
+    heap.push(100, "a")
+    heap.push(200, "b")
+
+    assert [entry[2] for entry in heap.pop_due(250)] == ["a", "b"]
+    assert heap.next_due() == 300
+    assert len(heap) == 1
+
+
+def test_equal_due_times_keep_insertion_order() -> None:
+    heap = TimerHeap()
+    for item in "abc":
+        heap.push(100, item)
+
+    assert [entry[2] for entry in heap.pop_due(100)] == ["a", "b", "c"]
+
+
+def test_cancelled_events_are_skipped() -> None:
+    heap = TimerHeap()
+    first = heap.push(100, "a")
+    heap.push(200, "b")
+
+    heap.cancel(first)
+    heap.cancel(first)
+
+    assert len(heap) == 1
+    assert heap.next_due() == 200
+    assert [entry[2] for entry in heap.pop_due(1000)] == ["b"]
+    assert heap.next_due() is None
+
+
+def test_heap_is_compacted_when_most_entries_are_cancelled() -> None:
+    heap = TimerHeap()
+    entries = [heap.push(due, due) for due in range(10)]
+
+    for entry in entries[:6]:
+        heap.cancel(entry)
+
+    assert len(heap._heap) == 4
+    assert [entry[2] for entry in heap.pop_due(100)] == [6, 7, 8, 9]
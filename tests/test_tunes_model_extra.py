@@ -1,3 +1,5 @@
+from dataclasses import replace
+
 import pytest
 
 from timer_2.tune_key import TuneKey
@@ -48,3 +50,21 @@ def test_reject_bool_for_min_sec_setting() -> None:
 
     with pytest.raises(ValueError):
         model.set_value(TuneKey.MS_M, False)
+
+
+def test_set_values_applies_all_values() -> None:
+    model = default_model()
+
+    model.set_values({TuneKey.HM_H: "7", TuneKey.HM_M: 30, TuneKey.MS_S: 0})
+
+    assert (model.hm_h, model.hm_m, model.ms_s) == (7, 30, 0)
+
+
+def test_set_values_leaves_model_unchanged_on_invalid_value() -> None:
+    model = default_model()
+    before = replace(model)
+
+    with pytest.raises(ValueError):
+        model.set_values({TuneKey.MS_M: "5", TuneKey.MS_S: "75"})
+
+    assert model == before
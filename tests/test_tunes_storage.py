@@ -1,10 +1,13 @@
 from __future__ import annotations
 
 import json
+import time
+from dataclasses import replace
 from pathlib import Path
 
 import pytest
 
+from timer_2.const import Const as C
 from timer_2.tunes_mapper import default_dto, dto_to_json_dict
 from timer_2.tunes_storage import (
     ACTIVE_SETTINGS_FILE_NAME,
@@ -46,6 +49,187 @@ def test_save_writes_current_settings_file() -> None:
     assert data["version"] == dto.version
 
 
+def test_clean_start_does_not_write_files() -> None:
+    TunesStorage().load()
+    settings_mtime = TunesStorage().settings_file.stat().st_mtime_ns
+
+    storage = TunesStorage()
+    storage.load()
+
+    assert storage.writes == 0
+    assert storage.skipped_writes == 1
+    assert storage.settings_file.stat().st_mtime_ns == settings_mtime
+
+
+def test_clean_start_does_not_write_files_through_symlinked_appdata(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    real = tmp_path / "real"
+    real.mkdir()
+    link = tmp_path / "link"
+    link.symlink_to(real, target_is_directory=True)
+    monkeypatch.setenv("APPDATA", str(link))
+    TunesStorage().load()
+
+    storage = TunesStorage()
+    storage.load()
+
+    assert storage.writes == 0
+    assert storage.skipped_writes == 1
+
+
+def test_unchanged_content_is_written_after_external_edit() -> None:
+    storage = TunesStorage()
+    dto = storage.load()
+    storage.settings_file.write_text("{}", encoding="utf-8")
+
+    storage.save(dto)
+
+    data = json.loads(storage.settings_file.read_text(encoding="utf-8"))
+    assert data == dto_to_json_dict(dto)
+
+
+def test_switch_to_same_file_does_not_rewrite_registry(tmp_path: Path) -> None:
+    settings_file = tmp_path / "custom" / "profile.json"
+    TunesStorage().switch_settings_file(settings_file)
+
+    storage = TunesStorage()
+    storage.switch_settings_file(settings_file)
+
+    assert storage.writes == 0
+
+
+def test_save_keeps_previous_version_as_backup() -> None:
+    storage = TunesStorage()
+    storage.load()
+    dto = default_dto()
+    dto.voice_interval = 22
+
+    storage.save(dto)
+
+    backup = storage.settings_file.with_name("user.json.bak")
+    assert json.loads(backup.read_text(encoding="utf-8")) == dto_to_json_dict(
+        default_dto()
+    )
+    assert not storage.settings_file.with_name("user.json.tmp").exists()
+    assert storage.save_ms.count == storage.writes
+
+
+def test_corrupt_settings_file_falls_back_to_backup(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(C, "TUNES_FSYNC_INTERVAL_MS", 0)
+    storage = TunesStorage()
+    storage.load()
+    dto = default_dto()
+    dto.voice_interval = 22
+    storage.save(dto)
+    dto.voice_interval = 33
+    storage.save(dto)
+    storage.settings_file.write_text("{", encoding="utf-8")
+
+    restored = TunesStorage()
+    loaded = restored.load()
+
+    assert loaded.voice_interval == 22
+    [warning] = restored.pop_warnings()
+    assert "повреждён" in warning
+    assert "восстановлены из резервной копии" in warning
+    assert "по умолчанию" not in warning
+
+
+def test_missing_settings_file_falls_back_to_backup(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(C, "TUNES_FSYNC_INTERVAL_MS", 0)
+    storage = TunesStorage()
+    storage.load()
+    dto = default_dto()
+    dto.voice_interval = 22
+    storage.save(dto)
+    dto.voice_interval = 33
+    storage.save(dto)
+    storage.settings_file.unlink()
+
+    assert TunesStorage().load().voice_interval == 22
+
+
+def test_fsync_is_rate_limited_and_completed_by_flush(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(C, "TUNES_FSYNC_INTERVAL_MS", 60_000)
+    storage = TunesStorage()
+    storage.load()
+    dto = default_dto()
+
+    for seconds in range(1, 4):
+        dto.ms_s = seconds
+        storage.save(dto)
+    assert storage.fsyncs == 1
+
+    storage.flush()
+    assert storage.fsyncs == 2
+
+
+def test_backup_keeps_last_synced_version_within_fsync_window(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(C, "TUNES_FSYNC_INTERVAL_MS", 60_000)
+    storage = TunesStorage()
+    storage.load()
+    backup = storage.settings_file.with_name("user.json.bak")
+    dto = default_dto()
+
+    for seconds in range(1, 4):
+        dto.ms_s = seconds
+        storage.save(dto)
+
+    assert json.loads(backup.read_text(encoding="utf-8"))["ms_s"] == 0
+
+    storage.flush()
+    dto.ms_s = 4
+    storage.save(dto)
+
+    assert json.loads(backup.read_text(encoding="utf-8"))["ms_s"] == 3
+
+
+def test_save_later_coalesces_changes_into_one_write(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(C, "TUNES_SAVE_DELAY_MS", 60_000)
+    storage = TunesStorage()
+    dto = default_dto()
+
+    for seconds in range(4):
+        dto.ms_s = seconds
+        storage.save_later(replace(dto))
+    storage.flush()
+
+    data = json.loads(storage.settings_file.read_text(encoding="utf-8"))
+    assert data["ms_s"] == 3
+    assert storage.writer.stats.requests == 4
+    assert storage.writer.stats.writes == 1
+    assert storage.writer.stats.avoided == 3
+
+
+def test_save_later_writes_in_background_after_delay(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(C, "TUNES_SAVE_DELAY_MS", 20)
+    storage = TunesStorage()
+    dto = default_dto()
+    dto.voice_interval = 33
+
+    storage.save_later(dto)
+    deadline = time.monotonic() + 5
+    while storage.writer.stats.writes == 0 and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    data = json.loads(storage.settings_file.read_text(encoding="utf-8"))
+    assert data["voice_interval"] == 33
+    assert storage.writer.stats.writes == 1
+
+
 def test_load_existing_valid_settings_file() -> None:
     storage = TunesStorage()
     dto = default_dto()
@@ -65,7 +249,10 @@ def test_load_invalid_json_returns_defaults_and_warning() -> None:
     dto = storage.load()
 
     assert dto == default_dto()
-    assert any("повреждён" in warning for warning in storage.pop_warnings())
+    [warning] = storage.pop_warnings()
+    assert "повреждён" in warning
+    assert "по умолчанию" in warning
+    assert "резервной копии" not in warning
 
 
 def test_load_non_dict_json_returns_defaults_and_warning() -> None:
@@ -108,3 +295,42 @@ def test_broken_active_registry_falls_back_to_default(
     storage = TunesStorage()
 
     assert storage.settings_file.name == "user.json"
+
+
+def test_switch_back_to_unchanged_profile_uses_cache(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    first = tmp_path / "first.json"
+    second = tmp_path / "second.json"
+    storage = TunesStorage()
+    dto = default_dto()
+    dto.voice_interval = 22
+    storage.switch_settings_file(first)
+    storage.save(dto)
+    storage.switch_settings_file(second)
+
+    def fail(path: Path) -> None:
+        raise AssertionError(f"profile was read: {path}")
+
+    monkeypatch.setattr(storage, "_read_settings_dict", fail)
+    writes = storage.writes
+    loaded = storage.switch_settings_file(first)
+
+    assert loaded.voice_interval == 22
+    assert storage.profile_hits == 1
+    assert storage.writes == writes + 1  # только active_settings.json
+
+
+def test_changed_profile_is_read_again(tmp_path: Path) -> None:
+    first = tmp_path / "first.json"
+    storage = TunesStorage()
+    storage.switch_settings_file(first)
+    storage.switch_settings_file(tmp_path / "second.json")
+    data = dto_to_json_dict(default_dto())
+    data["voice_interval"] = 44
+    first.write_text(json.dumps(data), encoding="utf-8")
+
+    loaded = storage.switch_settings_file(first)
+
+    assert loaded.voice_interval == 44
+    assert storage.profile_hits == 0